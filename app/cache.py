@@ -0,0 +1,117 @@
+"""
+Small in-process caches shared by the worker and the API.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Thread-safe mapping bounded to ``maxsize`` entries; the least recently
+    used entry is evicted first. ``maxsize <= 0`` disables caching.
+
+    ``ttl`` (seconds, 0 = none) expires entries. Entries may carry a
+    ``version``: a lookup with a different version is a miss and drops the
+    entry (e.g. results cached under an older data generation).
+    """
+
+    def __init__(self, maxsize: int, ttl: float = 0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key → (value, version, expires_at)
+        self._data: "OrderedDict[K, Tuple[V, Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0  # TTL expired or stale version
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _lookup(self, key: K, version: Any) -> Tuple[bool, Optional[V]]:
+        # Caller holds the lock
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+        value, entry_version, expires_at = entry
+        if entry_version != version or (expires_at and expires_at <= time.monotonic()):
+            del self._data[key]
+            self.expirations += 1
+            self.misses += 1
+            return False, None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return True, value
+
+    def get(
+        self, key: K, default: Optional[V] = None, version: Any = None
+    ) -> Optional[V]:
+        with self._lock:
+            found, value = self._lookup(key, version)
+        return value if found else default
+
+    def get_many(self, keys: Iterable[K]) -> Dict[K, V]:
+        """Cached subset of ``keys`` (missing keys are left out)."""
+        found: Dict[K, V] = {}
+        with self._lock:
+            for key in keys:
+                hit, value = self._lookup(key, None)
+                if hit:
+                    found[key] = value
+        return found
+
+    def put(self, key: K, value: V, version: Any = None) -> None:
+        if self.maxsize <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0.0
+        with self._lock:
+            self._data[key] = (value, version, expires_at)
+            self._data.move_to_end(key)
+            self._evict()
+
+    def update(self, items: Mapping[K, V]) -> None:
+        if self.maxsize <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0.0
+        with self._lock:
+            for key, value in items.items():
+                self._data[key] = (value, None, expires_at)
+                self._data.move_to_end(key)
+            self._evict()
+
+    def _evict(self) -> None:
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
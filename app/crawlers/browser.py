@@ -0,0 +1,441 @@
+"""
+Chrome WebDriver construction and a warm per-process driver pool.
+
+Starting Chrome + chromedriver costs 1–3 s, so the worker keeps drivers alive
+between jobs and hands them out through ``DriverPool``. Drivers are reset
+(cookies, storage, about:blank) when returned and recycled after a number of
+jobs/pages or when the resident memory of their process tree (chromedriver,
+browser, renderers) grows past a threshold.
+
+The chromedriver binary is resolved once per process (``resolve_chromedriver``)
+and remembered on disk per Chrome version.
+
+Scrapers only need the DOM, so by default pages load with the ``eager``
+strategy and images, fonts, media and analytics requests are blocked via CDP
+(``apply_resource_blocking``).
+"""
+
+import functools
+import json
+import os
+import re
+import subprocess
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+from app.config import (
+    CHROMEDRIVER_CACHE_FILE,
+    CHROMEDRIVER_OFFLINE,
+    DRIVER_MAX_JOBS,
+    DRIVER_MAX_MEMORY_MB,
+    DRIVER_MAX_PAGES,
+    DRIVER_POOL_SIZE,
+    SCRAPER_PAGE_LOAD_STRATEGY,
+)
+
+_BLOCKED_EXTENSIONS = (
+    # images
+    "png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico", "bmp",
+    # fonts
+    "woff", "woff2", "ttf", "otf", "eot",
+    # media
+    "mp4", "webm", "mp3", "ogg", "wav", "m4a",
+)  # fmt: skip
+
+_BLOCKED_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "connect.facebook.net",
+    "hotjar.com",
+    "segment.io",
+    "scorecardresearch.com",
+)
+
+
+def _url_patterns(extensions: Sequence[str], domains: Sequence[str]) -> List[str]:
+    """Network.setBlockedURLs wildcard patterns for extensions and domains."""
+    return [p for ext in extensions for p in (f"*.{ext}", f"*.{ext}?*")] + [
+        f"*{domain}*" for domain in domains
+    ]
+
+
+BLOCKED_URL_PATTERNS = tuple(_url_patterns(_BLOCKED_EXTENSIONS, _BLOCKED_DOMAINS))
+
+
+def chrome_version(chrome_bin: Optional[str] = None) -> Optional[str]:
+    """Return the installed Chrome/Chromium version (e.g. "126.0.6478.126")."""
+    binaries = [chrome_bin] if chrome_bin else ["google-chrome", "chromium"]
+    for binary in binaries:
+        try:
+            out = subprocess.run(
+                [binary, "--version"], capture_output=True, text=True, timeout=10
+            ).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r"\d+(?:\.\d+)+", out)
+        if match:
+            return match.group(0)
+    return None
+
+
+def _load_driver_cache() -> Dict[str, str]:
+    try:
+        with open(CHROMEDRIVER_CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_driver_cache(cache: Dict[str, str]) -> None:
+    try:
+        os.makedirs(os.path.dirname(CHROMEDRIVER_CACHE_FILE), exist_ok=True)
+        with open(CHROMEDRIVER_CACHE_FILE, "w") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"Could not write chromedriver cache: {type(e).__name__}: {e}")
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_chromedriver() -> Optional[str]:
+    """
+    Resolve the chromedriver binary once per process. Order:
+    CHROMEDRIVER_PATH → on-disk cache for the installed Chrome version →
+    webdriver-manager (skipped when CHROMEDRIVER_OFFLINE) → None, meaning
+    Selenium looks it up on PATH.
+    """
+    chromedriver_path = os.environ.get("CHROMEDRIVER_PATH")
+    if chromedriver_path and os.path.isfile(chromedriver_path):
+        return chromedriver_path
+
+    version = chrome_version(os.environ.get("CHROME_BIN"))
+    cache = _load_driver_cache()
+    cached = cache.get(version) if version else None
+    if cached and os.path.isfile(cached):
+        return cached
+
+    if CHROMEDRIVER_OFFLINE:
+        # Also keep Selenium Manager from downloading a driver
+        os.environ.setdefault("SE_OFFLINE", "true")
+        return None
+
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+    except ImportError:
+        return None  # fallback to PATH
+
+    try:
+        path = ChromeDriverManager().install()
+    except Exception as e:
+        print(f"chromedriver download failed: {type(e).__name__}: {e}")
+        return None
+
+    if version:
+        cache[version] = path
+        _save_driver_cache(cache)
+    return path
+
+
+def create_chrome_driver(
+    headless: bool = True,
+    page_load_strategy: str = SCRAPER_PAGE_LOAD_STRATEGY,
+) -> webdriver.Chrome:
+    """
+    Start a new Chrome WebDriver with the scrapers' default options.
+
+    ``page_load_strategy``: "normal" waits for the load event, "eager" for
+    DOMContentLoaded, "none" returns right away (callers wait for elements).
+    """
+    options = Options()
+    options.page_load_strategy = page_load_strategy
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--window-size=1920,1080")
+
+    # Modern anti-detection (very often needed in 2025+)
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option("useAutomationExtension", False)
+
+    chrome_bin = os.environ.get("CHROME_BIN")
+    if chrome_bin:
+        options.binary_location = chrome_bin
+
+    chromedriver_path = resolve_chromedriver()
+    service = Service(chromedriver_path) if chromedriver_path else Service()
+
+    driver = webdriver.Chrome(service=service, options=options)
+
+    # Better webdriver hiding (executed on every new document)
+    # fmt: off
+    driver.execute_cdp_cmd(
+        "Page.addScriptToEvaluateOnNewDocument",
+        {"source": """
+            Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
+            Object.defineProperty(navigator, 'languages',
+                { get: () => ['en-US', 'en'] });
+            Object.defineProperty(navigator, 'plugins',
+                { get: () => [1, 2, 3, 4, 5] });
+        """},
+    )
+    # fmt: on
+    return driver
+
+
+def blocked_url_patterns(unblocked: Sequence[str] = ()) -> List[str]:
+    """
+    ``BLOCKED_URL_PATTERNS`` minus the categories in ``unblocked``: blocked
+    file extensions ("svg") or analytics domains ("googletagmanager.com").
+    Not arbitrary URLs: CDP blocking only works with those wildcard patterns.
+    """
+    unknown = set(unblocked) - set(_BLOCKED_EXTENSIONS) - set(_BLOCKED_DOMAINS)
+    if unknown:
+        raise ValueError(
+            f"Not a blocked extension or domain: {sorted(unknown)} "
+            f"(expected one of {_BLOCKED_EXTENSIONS + _BLOCKED_DOMAINS})"
+        )
+    return _url_patterns(
+        [ext for ext in _BLOCKED_EXTENSIONS if ext not in unblocked],
+        [domain for domain in _BLOCKED_DOMAINS if domain not in unblocked],
+    )
+
+
+def apply_resource_blocking(
+    driver: webdriver.Chrome,
+    block: bool = True,
+    unblocked: Sequence[str] = (),
+) -> None:
+    """
+    Block images, fonts, media and analytics requests for ``driver``, except
+    the extensions/domains in ``unblocked`` (see ``blocked_url_patterns``).
+    ``block=False`` clears blocking left by a previous user of a pooled driver.
+    """
+    patterns = blocked_url_patterns(unblocked) if block else []
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+
+def process_tree_rss_mb(pid: int) -> Optional[float]:
+    """
+    Resident memory (MB) of ``pid`` and all its descendants, read from /proc.
+    None where /proc isn't available (non-Linux) or ``pid`` is gone.
+    """
+    children: Dict[int, List[int]] = {}
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return None
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue  # exited meanwhile
+        # comm (2nd field) may hold spaces and parentheses: ppid is the 2nd
+        # field after the last ")"
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+
+    total_kb = None
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        stack.extend(children.get(current, ()))
+        try:
+            with open(f"/proc/{current}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total_kb = (total_kb or 0) + int(line.split()[1])
+                        break
+        except OSError:
+            continue
+    return None if total_kb is None else total_kb / 1024
+
+
+def driver_rss_mb(driver: webdriver.Chrome) -> Optional[float]:
+    """``process_tree_rss_mb`` of the chromedriver process behind ``driver``."""
+    try:
+        pid = int(driver.service.process.pid)
+    except (AttributeError, TypeError, ValueError):
+        return None  # no local service (e.g. remote driver)
+    return process_tree_rss_mb(pid)
+
+
+class PooledDriver:
+    """A pooled WebDriver plus the usage counters used to decide recycling."""
+
+    def __init__(self, driver: webdriver.Chrome):
+        self.driver = driver
+        self.jobs = 0
+        self.pages = 0
+
+
+class DriverPool:
+    """
+    Keeps up to ``size`` initialized drivers alive and hands them out.
+
+    Usage:
+        with pool.acquire() as pooled:
+            pooled.driver.get(url)
+            pooled.pages += 1
+    """
+
+    def __init__(
+        self,
+        size: int = DRIVER_POOL_SIZE,
+        headless: bool = True,
+        max_jobs: int = DRIVER_MAX_JOBS,
+        max_pages: int = DRIVER_MAX_PAGES,
+        max_memory_mb: int = DRIVER_MAX_MEMORY_MB,
+        page_load_strategy: str = SCRAPER_PAGE_LOAD_STRATEGY,
+        factory: Optional[Callable[[], webdriver.Chrome]] = None,
+    ):
+        self.size = max(1, size)
+        self.max_jobs = max_jobs
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self._factory = factory or (
+            lambda: create_chrome_driver(headless, page_load_strategy)
+        )
+        self._cond = threading.Condition()
+        self._idle: List[PooledDriver] = []
+        self._total = 0  # idle + checked out
+        self._closed = False
+
+    def warm(self) -> None:
+        """Start drivers until the pool holds ``size`` of them."""
+        while True:
+            with self._cond:
+                if self._closed or self._total >= self.size:
+                    return
+                self._total += 1
+            pooled = self._create()
+            with self._cond:
+                if not self._closed:
+                    self._idle.append(pooled)
+                    self._cond.notify()
+                    continue
+            self.discard(pooled)
+            return
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Iterator[PooledDriver]:
+        pooled = self.checkout(timeout)
+        try:
+            yield pooled
+        finally:
+            self.checkin(pooled)
+
+    def checkout(self, timeout: Optional[float] = None) -> PooledDriver:
+        """
+        Take an idle driver (replaced if its browser died while idle), start
+        a new one if below ``size``, or wait.
+        """
+        while True:
+            with self._cond:
+                while not self._closed and not self._idle and self._total >= self.size:
+                    if not self._cond.wait(timeout):
+                        raise TimeoutError("No WebDriver available in pool")
+                if self._closed:
+                    raise RuntimeError("WebDriver pool is closed")
+                if not self._idle:
+                    self._total += 1
+                    break
+                pooled = self._idle.pop()
+            if self._is_alive(pooled.driver):
+                return pooled
+            print("Idle driver is not responding → replacing it")
+            self.discard(pooled)
+        return self._create()
+
+    def checkin(self, pooled: PooledDriver) -> None:
+        """Return a driver after a job: reset it, or quit it if due for recycling."""
+        pooled.jobs += 1
+        if not self._closed and not self._should_recycle(pooled):
+            try:
+                self._reset(pooled.driver)
+            except WebDriverException as e:
+                print(f"Driver reset failed, recycling: {type(e).__name__}: {e}")
+            else:
+                with self._cond:
+                    if not self._closed:
+                        self._idle.append(pooled)
+                        self._cond.notify()
+                        return
+        self.discard(pooled)
+
+    def close(self) -> None:
+        """
+        Quit all idle drivers and refuse further checkouts; drivers still
+        checked out are quit on checkin.
+        """
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for pooled in idle:
+            self.discard(pooled)
+
+    def _create(self) -> PooledDriver:
+        try:
+            return PooledDriver(self._factory())
+        except Exception:
+            with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            raise
+
+    def discard(self, pooled: PooledDriver) -> None:
+        """Quit a driver (checked out or idle-removed) and free its slot."""
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+        with self._cond:
+            self._total -= 1
+            self._cond.notify()
+
+    def _should_recycle(self, pooled: PooledDriver) -> bool:
+        if self.max_jobs and pooled.jobs >= self.max_jobs:
+            return True
+        if self.max_pages and pooled.pages >= self.max_pages:
+            return True
+        if self.max_memory_mb:
+            # Whole process tree: the JS heap of the page being reset says
+            # nothing about renderer/browser growth
+            rss = driver_rss_mb(pooled.driver)
+            if rss is not None and rss >= self.max_memory_mb:
+                return True
+        return False
+
+    @staticmethod
+    def _is_alive(driver: webdriver.Chrome) -> bool:
+        try:
+            driver.execute_script("return 1")
+        except WebDriverException:
+            return False
+        return True
+
+    @staticmethod
+    def _reset(driver: webdriver.Chrome) -> None:
+        """Clear cookies/storage left by the previous job and park on about:blank."""
+        origin = driver.execute_script("return window.location.origin")
+        if origin and origin != "null":
+            driver.execute_cdp_cmd(
+                "Storage.clearDataForOrigin",
+                {"origin": origin, "storageTypes": "all"},
+            )
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.get("about:blank")
@@ -1,25 +1,48 @@
+import hashlib
 import json
-import os
 import re
-import time
-import urllib.request
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 from urllib.parse import urljoin
 
+import requests
 from selenium import webdriver
 from selenium.common.exceptions import (
     NoSuchElementException,
     StaleElementReferenceException,
     TimeoutException,
 )
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC  # noqa: N812
 from selenium.webdriver.support.ui import WebDriverWait
 
-from app.config import SCRAPER_URLS
+from app.config import (
+    HOCKEY_ENGINE,
+    SCRAPER_BLOCK_RESOURCES,
+    SCRAPER_INGEST,
+    SCRAPER_URLS,
+)
+from app.crawlers.browser import (
+    DriverPool,
+    PooledDriver,
+    apply_resource_blocking,
+    create_chrome_driver,
+)
+from app.crawlers.http_cache import CacheStats
+from app.crawlers.http_client import fetch_text
+from app.crawlers.parsers import parse_page_numbers, parse_table_rows
+from app.crawlers.pipeline import PageWriter, ordered_map
+from app.crawlers.ratelimit import get_limiter
+from app.crawlers.storage import (
+    INGEST_MODES,
+    copy_hockey_historic,
+    copy_oscar_winners,
+    id_cache,
+    resolve_ids,
+    supports_copy,
+    upsert_rows,
+)
 from app.database import Session
 from app.models.hockey_teams import HockeyTeam, HockeyTeamHistoric
 
@@ -27,10 +50,51 @@ from app.models.hockey_teams import HockeyTeam, HockeyTeamHistoric
 class Scraper:
     """Base class for all Selenium-based scrapers"""
 
-    def __init__(self, headless: bool = True, timeout: int = 12):
+    # Blocked resource categories this scraper still needs with blocking on:
+    # file extensions ("svg") or analytics domains ("googletagmanager.com")
+    UNBLOCKED_RESOURCES: Sequence[str] = ()
+
+    def __init__(
+        self,
+        headless: bool = True,
+        timeout: int = 12,
+        driver_pool: Optional[DriverPool] = None,
+        block_resources: bool = SCRAPER_BLOCK_RESOURCES,
+        unblocked_resources: Optional[Sequence[str]] = None,
+        incremental: bool = False,
+        known_fingerprints: Optional[Dict[str, str]] = None,
+        ingest: str = SCRAPER_INGEST,
+    ):
+        if ingest not in INGEST_MODES:
+            raise ValueError(f"Unknown ingest: {ingest!r} (expected {INGEST_MODES})")
         self.headless = headless
         self.timeout = timeout
         self.driver: Optional[webdriver.Chrome] = None
+        self.block_resources = block_resources
+        self.unblocked_resources = (
+            self.UNBLOCKED_RESOURCES
+            if unblocked_resources is None
+            else unblocked_resources
+        )
+        # When set, drivers are borrowed from (and returned to) a warm pool
+        self.driver_pool = driver_pool
+        self._pooled: Optional[PooledDriver] = None
+        self.pages_loaded = 0
+        # HTTP cache hits/misses of this scraper (one scraper per job)
+        self.cache_stats = CacheStats()
+        # Incremental mode: units (pages/years) whose payload fingerprint
+        # matches the last successful job are skipped (no parsing, no DB writes)
+        self.incremental = incremental
+        self.known_fingerprints = dict(known_fingerprints or {})
+        self.fingerprints: Dict[str, str] = {}
+        # Fingerprints of fetched units not consumed yet: fetches run ahead of
+        # the consumer, and a unit past an early stop must not be recorded
+        self._fetched_fingerprints: Dict[str, str] = {}
+        self.units_skipped = 0
+        self.units_refreshed = 0
+        # DB ingestion backend: "orm" (bulk statements) or "copy" (PostgreSQL
+        # COPY into a staging table; falls back to "orm" on other databases)
+        self.ingest = ingest
 
     def __enter__(self):
         self._init_driver()
@@ -39,60 +103,70 @@ class Scraper:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
+    def _ensure_driver(self) -> None:
+        """Start the WebDriver on demand (engines that may not need a browser)."""
+        if self.driver is None:
+            self._init_driver()
+
     def _init_driver(self) -> None:
-        options = Options()
-        if self.headless:
-            options.add_argument("--headless=new")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--window-size=1920,1080")
-
-        # Modern anti-detection (very often needed in 2025+)
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option("useAutomationExtension", False)
-
-        # Use system chromedriver if available (Docker), otherwise try webdriver-manager
-        chromedriver_path = os.environ.get("CHROMEDRIVER_PATH")
-        chrome_bin = os.environ.get("CHROME_BIN")
-
-        if chrome_bin:
-            options.binary_location = chrome_bin
-
-        if chromedriver_path and os.path.isfile(chromedriver_path):
-            service = Service(chromedriver_path)
+        if self.driver_pool is not None:
+            self._pooled = self.driver_pool.checkout()
+            self.driver = self._pooled.driver
         else:
-            try:
-                from webdriver_manager.chrome import ChromeDriverManager
-
-                service = Service(ChromeDriverManager().install())
-            except ImportError:
-                service = Service()  # fallback to PATH
-
-        self.driver = webdriver.Chrome(service=service, options=options)
-
-        # Better webdriver hiding (executed on every new document)
-        # fmt: off
-        self.driver.execute_cdp_cmd(
-            "Page.addScriptToEvaluateOnNewDocument",
-            {"source": """
-                Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
-                Object.defineProperty(navigator, 'languages',
-                    { get: () => ['en-US', 'en'] });
-                Object.defineProperty(navigator, 'plugins',
-                    { get: () => [1, 2, 3, 4, 5] });
-            """},
-        )
-        # fmt: on
+            self.driver = create_chrome_driver(self.headless)
+        try:
+            apply_resource_blocking(
+                self.driver, self.block_resources, self.unblocked_resources
+            )
+        except Exception:
+            # Raised from __enter__, so __exit__ won't release the driver
+            if self._pooled is not None:
+                pooled, self._pooled = self._pooled, None
+                self.driver_pool.discard(pooled)
+            else:
+                try:
+                    self.driver.quit()
+                except Exception:
+                    pass
+            self.driver = None
+            raise
+
+    def _is_unchanged(self, unit: str, payload: str) -> bool:
+        """
+        Stage the payload fingerprint of ``unit`` (recorded by
+        ``_record_fingerprint`` once consumed); True if it can be skipped.
+        """
+        fingerprint = hashlib.sha256(payload.encode()).hexdigest()
+        self._fetched_fingerprints[unit] = fingerprint
+        return self.incremental and self.known_fingerprints.get(unit) == fingerprint
+
+    def _record_fingerprint(self, unit: str) -> None:
+        """Keep the fingerprint of ``unit`` after its rows were handed over/skipped."""
+        fingerprint = self._fetched_fingerprints.pop(unit, None)
+        if fingerprint is not None:
+            self.fingerprints[unit] = fingerprint
+
+    def _use_copy(self, session) -> bool:
+        return self.ingest == "copy" and supports_copy(session)
+
+    def _navigate(self, url: str) -> None:
+        with get_limiter(url):
+            self.driver.get(url)
+        self.pages_loaded += 1
 
     def close(self) -> None:
-        if self.driver is not None:
+        if self._pooled is not None:
+            pooled, self._pooled = self._pooled, None
+            pooled.pages += self.pages_loaded
+            self.driver_pool.checkin(pooled)
+            self.driver = None
+        elif self.driver is not None:
             try:
                 self.driver.quit()
             except Exception:
                 pass
             self.driver = None
+        self.pages_loaded = 0
 
 
 class HockeyHistoricScraper(Scraper):
@@ -101,8 +175,62 @@ class HockeyHistoricScraper(Scraper):
     TABLE_ID = SCRAPER_URLS["hockey"]["table_id"]
     PAGINATION_SELECTOR = SCRAPER_URLS["hockey"]["pagination_selector"]
     PAGE_PARAM = SCRAPER_URLS["hockey"]["page_param"]
+    MAX_CONCURRENCY = SCRAPER_URLS["hockey"]["max_concurrency"]
+
+    ENGINES = ("auto", "http", "selenium")
+    # "html": whole table in one WebDriver call (outerHTML), parsed in Python
+    # "elements": legacy find_elements/.text per row and cell
+    EXTRACTIONS = ("html", "elements")
+
+    def __init__(
+        self,
+        headless: bool = True,
+        timeout: int = 12,
+        engine: str = HOCKEY_ENGINE,
+        max_concurrency: Optional[int] = None,
+        extraction: str = "html",
+        **kwargs,
+    ):
+        super().__init__(headless=headless, timeout=timeout, **kwargs)
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine: {engine!r} (expected {self.ENGINES})")
+        if extraction not in self.EXTRACTIONS:
+            raise ValueError(
+                f"Unknown extraction: {extraction!r} (expected {self.EXTRACTIONS})"
+            )
+        self.engine = engine
+        self.extraction = extraction
+        # Pages fetched in parallel by the HTTP engine (1 = sequential)
+        self.max_concurrency = max(1, max_concurrency or self.MAX_CONCURRENCY)
+
+    def __enter__(self):
+        # The HTTP engine only needs a browser as fallback → start it lazily
+        if self.engine == "selenium":
+            self._init_driver()
+        return self
+
+    @staticmethod
+    def _cells_to_entry(cells: List[str]) -> Dict[str, str]:
+        return {
+            "name": cells[0].strip(),
+            "year": cells[1].strip(),
+            "wins": cells[2].strip(),
+            "losses": cells[3].strip(),
+            "losses_ot": cells[4].strip(),
+            "wins_percentage": cells[5].strip(),
+            "goals_for": cells[6].strip(),
+            "goals_against": cells[7].strip(),
+            "goal_difference": cells[8].strip(),
+        }
 
     def parse_page_data(self, page_data: WebElement) -> List[Dict[str, str]]:
+        if self.extraction == "html":
+            try:
+                html = page_data.get_attribute("outerHTML")
+            except StaleElementReferenceException:
+                return []
+            return self.parse_html(html) or []
+
         table = page_data.find_element(By.TAG_NAME, "table")
         rows = table.find_elements(By.TAG_NAME, "tr")[1:]  # skip header
 
@@ -113,23 +241,19 @@ class HockeyHistoricScraper(Scraper):
                 if len(cells) < 9:
                     continue
 
-                entry = {
-                    "name": cells[0].text.strip(),
-                    "year": cells[1].text.strip(),
-                    "wins": cells[2].text.strip(),
-                    "losses": cells[3].text.strip(),
-                    "losses_ot": cells[4].text.strip(),
-                    "wins_percentage": cells[5].text.strip(),
-                    "goals_for": cells[6].text.strip(),
-                    "goals_against": cells[7].text.strip(),
-                    "goal_difference": cells[8].text.strip(),
-                }
-                data.append(entry)
+                data.append(self._cells_to_entry([cell.text for cell in cells[:9]]))
             except StaleElementReferenceException:
                 continue  # row disappeared → skip
 
         return data
 
+    def parse_html(self, html: str) -> Optional[List[Dict[str, str]]]:
+        """Parse the #hockey table from raw HTML (None if the table is missing)."""
+        rows = parse_table_rows(html, self.TABLE_ID)
+        if rows is None:
+            return None
+        return [self._cells_to_entry(cells) for cells in rows if len(cells) >= 9]
+
     def _extract_page_data(self) -> WebElement:
         try:
             page_data = WebDriverWait(self.driver, self.timeout).until(
@@ -177,17 +301,73 @@ class HockeyHistoricScraper(Scraper):
         job_id: str = None,
     ) -> List[Dict[str, str]]:
         """
-        Main entry point — collects data from all pages
+        Main entry point — collects data from all pages.
+
+        With ``save_per_page`` pages are persisted by a ``PageWriter`` thread
+        while the next pages are fetched; otherwise everything is saved at the
+        end in one transaction.
+        """
+        all_data: List[Dict[str, str]] = []
+
+        if save_per_page:
+            with PageWriter(lambda rows: self.save_to_database(rows, job_id)) as writer:
+                for _, parsed_data in self.iter_pages(base_url):
+                    writer.put(parsed_data)
+                    all_data.extend(parsed_data)
+        else:
+            for _, parsed_data in self.iter_pages(base_url):
+                all_data.extend(parsed_data)
+
+        print(f"Total collected: {len(all_data)} records")
+        if not save_per_page:
+            self.save_to_database(all_data, job_id)
+        return all_data
+
+    def crawl_historic_data(self, base_url: str, job_id: str = None) -> int:
+        """
+        Streaming entry point — persists pages as they arrive and returns the
+        number of rows. Rows are not accumulated, so memory stays flat
+        whatever the number of pages.
+        """
+        count = 0
+        with PageWriter(lambda rows: self.save_to_database(rows, job_id)) as writer:
+            for _, parsed_data in self.iter_pages(base_url):
+                writer.put(parsed_data)
+                count += len(parsed_data)
+
+        print(f"Total collected: {count} records")
+        return count
+
+    def iter_pages(self, base_url: str) -> Iterator[Tuple[int, List[Dict[str, str]]]]:
         """
+        Yield ``(page_number, rows)`` for every changed, non-empty page.
+
+        With the ``http``/``auto`` engines pages are fetched over plain HTTP;
+        ``auto`` falls back to Selenium when the response has no #hockey table.
+        """
+        if self.engine != "selenium":
+            first_page = self._fetch_first_page_http(base_url)
+            if first_page is not None:
+                yield from self._iter_pages_http(base_url, *first_page)
+                return
+            if self.engine == "http":
+                raise RuntimeError(f"#{self.TABLE_ID} table not found over HTTP")
+            print(f"No #{self.TABLE_ID} table over HTTP → falling back to Selenium")
+            self._ensure_driver()
+
+        yield from self._iter_pages_selenium(base_url)
+
+    def _iter_pages_selenium(
+        self, base_url: str
+    ) -> Iterator[Tuple[int, List[Dict[str, str]]]]:
         if not self.driver:
             raise RuntimeError("Driver not initialized. Use 'with' statement.")
 
-        all_data: List[Dict[str, str]] = []
         visited: set[str] = set()
 
         try:
             # ── First page ───────────────────────────────────────
-            self.driver.get(base_url)
+            self._navigate(base_url)
             WebDriverWait(self.driver, self.timeout).until(
                 EC.presence_of_element_located((By.ID, self.TABLE_ID))
             )
@@ -198,11 +378,11 @@ class HockeyHistoricScraper(Scraper):
             page_data = self._extract_page_data()
             if not page_data:
                 print("No records on page 1 → stopping")
-                return []
+                return
 
             parsed_data = self.parse_page_data(page_data)
-            all_data.extend(parsed_data)
             print(f"Page 1: {len(parsed_data)} records")
+            yield 1, parsed_data
 
             # ── Collect & sort pagination links ──────────────────
             page_urls = self._get_pagination_urls(base_url)
@@ -212,7 +392,7 @@ class HockeyHistoricScraper(Scraper):
                 if url in visited:
                     continue
 
-                self.driver.get(url)
+                self._navigate(url)
                 try:
                     WebDriverWait(self.driver, self.timeout).until(
                         EC.presence_of_element_located((By.ID, self.TABLE_ID))
@@ -226,24 +406,109 @@ class HockeyHistoricScraper(Scraper):
                 if not parsed_data:
                     print(f"No records on page {idx} → stopping")
                     break
-                if save_per_page:
-                    self.save_to_database(parsed_data, job_id)
-                all_data.extend(parsed_data)
                 visited.add(self.driver.current_url)
                 print(f"Page {idx}: {len(parsed_data)} records")
-
-            print(f"Total collected: {len(all_data)} records")
-            if not save_per_page:
-                self.save_to_database(all_data, job_id)
-            return all_data
+                yield idx, parsed_data
 
         except TimeoutException as e:
             raise TimeoutException(f"Timeout waiting for #{self.TABLE_ID} table") from e
         except Exception as e:
             raise RuntimeError(f"Scraping failed: {type(e).__name__}: {e}") from e
 
-    def save_to_database(self, data: List[Dict[str, str]], job_id: str = None) -> None:
-        """Save data to database"""
+    def _fetch_page_html(self, url: str) -> Tuple[Optional[List[Dict[str, str]]], bool]:
+        """Fetch and parse one page → (rows, unchanged). Unchanged: not parsed."""
+        try:
+            html = fetch_text(url, timeout=self.timeout, stats=self.cache_stats)
+        except requests.RequestException as e:
+            print(f"HTTP fetch failed for {url}: {type(e).__name__}: {e}")
+            return None, False
+        if self._is_unchanged(url, html):
+            return None, True
+        return self.parse_html(html), False
+
+    def _fetch_first_page_http(
+        self, base_url: str
+    ) -> Optional[Tuple[str, Optional[List[Dict[str, str]]]]]:
+        """
+        Fetch page 1 → (html, rows), rows None when unchanged. Returns None
+        when page 1 can't be read over HTTP (so the caller can fall back to
+        Selenium).
+        """
+        try:
+            html = fetch_text(base_url, timeout=self.timeout, stats=self.cache_stats)
+        except requests.RequestException as e:
+            print(f"HTTP fetch failed for {base_url}: {type(e).__name__}: {e}")
+            return None
+
+        if self._is_unchanged(base_url, html):
+            # Fingerprints are only kept from successful jobs → table was there
+            return html, None
+        parsed_data = self.parse_html(html)
+        if parsed_data is None:
+            return None
+        return html, parsed_data
+
+    def _iter_pages_http(
+        self,
+        base_url: str,
+        html: str,
+        first_page: Optional[List[Dict[str, str]]],
+    ) -> Iterator[Tuple[int, List[Dict[str, str]]]]:
+        """Browser-free engine, continuing after page 1 (``html``/``first_page``)."""
+        if first_page is None:
+            self.units_skipped += 1
+            print("Page 1: unchanged → skipped")
+        elif not first_page:
+            print("No records on page 1 → stopping")
+            return
+        else:
+            self.units_refreshed += 1
+            print(f"Page 1: {len(first_page)} records")
+            yield 1, first_page
+        self._record_fingerprint(base_url)
+
+        try:
+            page_numbers = [
+                n for n in parse_page_numbers(html, self.PAGE_PARAM) if n != 1
+            ]
+            urls = [urljoin(base_url, f"?{self.PAGE_PARAM}={n}") for n in page_numbers]
+
+            # Fetch/parse concurrently; results come in page order, so pages
+            # reach the consumer (and the DB) deterministically by page number.
+            # Only a window of pages is fetched ahead of the consumer.
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+                try:
+                    pages = ordered_map(
+                        pool, self._fetch_page_html, urls, 2 * self.max_concurrency
+                    )
+                    for page_number, url, (parsed_data, unchanged) in zip(
+                        page_numbers, urls, pages
+                    ):
+                        if unchanged:
+                            self.units_skipped += 1
+                            print(f"Page {page_number}: unchanged → skipped")
+                            self._record_fingerprint(url)
+                            continue
+                        if not parsed_data:
+                            print(f"No records on page {page_number} → stopping")
+                            break
+                        self.units_refreshed += 1
+                        print(f"Page {page_number}: {len(parsed_data)} records")
+                        yield page_number, parsed_data
+                        # Only once the consumer took the rows: pages fetched
+                        # ahead of an early stop keep no fingerprint
+                        self._record_fingerprint(url)
+                finally:
+                    # Stop pending fetches on early exit (empty page, consumer
+                    # error or generator closed)
+                    pool.shutdown(wait=False, cancel_futures=True)
+
+        except Exception as e:
+            raise RuntimeError(f"Scraping failed: {type(e).__name__}: {e}") from e
+
+    @staticmethod
+    def _historic_values(row: Dict[str, str]) -> Dict[str, float]:
+        """Numeric columns of a scraped row (unparsable cells → 0)."""
 
         def to_int(val, default=0):
             try:
@@ -257,32 +522,54 @@ class HockeyHistoricScraper(Scraper):
             except (ValueError, TypeError):
                 return default
 
+        return {
+            "year": to_int(row["year"]),
+            "wins": to_int(row["wins"]),
+            "losses": to_int(row["losses"]),
+            "losses_ot": to_int(row["losses_ot"]),
+            "wins_percentage": to_float(row["wins_percentage"]),
+            "goals_for": to_float(row["goals_for"]),
+            "goals_against": to_float(row["goals_against"]),
+            "goal_difference": to_float(row["goal_difference"]),
+        }
+
+    def save_to_database(self, data: List[Dict[str, str]], job_id: str = None) -> None:
+        """
+        Save data to database in one transaction: teams are resolved/created
+        in bulk, historic rows are upserted on (team, year) with a single
+        executemany (or streamed with COPY when ``ingest="copy"`` on
+        PostgreSQL). Each row records the job that last wrote it.
+        """
+        if not data:
+            return
+
         with Session() as session:
-            for row in data:
-                team = (
-                    session.query(HockeyTeam)
-                    .filter(HockeyTeam.name == row["name"])
-                    .one_or_none()
+            if self._use_copy(session):
+                copy_hockey_historic(
+                    session,
+                    (
+                        (row["name"], *self._historic_values(row).values())
+                        for row in data
+                    ),
+                    job_id,
+                )
+            else:
+                team_ids = resolve_ids(
+                    session, HockeyTeam.name, (r["name"] for r in data)
                 )
-                if not team:
-                    team = HockeyTeam(name=row["name"])
-                    session.add(team)
-                    session.commit()
-                    session.refresh(team)
-
-                historic = HockeyTeamHistoric(
-                    team_id=team.id,
-                    year=to_int(row["year"]),
-                    wins=to_int(row["wins"]),
-                    losses=to_int(row["losses"]),
-                    losses_ot=to_int(row["losses_ot"]),
-                    wins_percentage=to_float(row["wins_percentage"]),
-                    goals_for=to_float(row["goals_for"]),
-                    goals_against=to_float(row["goals_against"]),
-                    goal_difference=to_float(row["goal_difference"]),
-                    job_id=job_id,
+                upsert_rows(
+                    session,
+                    HockeyTeamHistoric,
+                    [
+                        {
+                            "team_id": team_ids[row["name"]],
+                            **self._historic_values(row),
+                            "job_id": job_id,
+                        }
+                        for row in data
+                    ],
+                    keys=("team_id", "year"),
                 )
-                session.add(historic)
             session.commit()
 
 
@@ -295,31 +582,36 @@ class OscarScraper(Scraper):
 
     Strategy: directly call the AJAX API for each year (2010-2015)
     which returns clean JSON — more reliable than DOM interaction.
+    Years are fetched concurrently over the pooled keep-alive session,
+    paced by the host's token-bucket rate limiter.
     """
 
     BASE_URL = SCRAPER_URLS["oscar"]["url"]
+    MAX_CONCURRENCY = SCRAPER_URLS["oscar"]["max_concurrency"]
+
+    def _fetch(self, url: str) -> str:
+        return fetch_text(url, timeout=15, stats=self.cache_stats)
 
     def get_years(self) -> List[int]:
         try:
-            req = urllib.request.Request(
-                self.BASE_URL, headers={"User-Agent": "Mozilla/5.0"}
-            )
-            with urllib.request.urlopen(req, timeout=15) as resp:
-                html = resp.read().decode("utf-8")
-                years = re.findall(r'class="year-link" id="(\d+)"', html)
-                return sorted(set([int(year) for year in years]))
+            html = self._fetch(self.BASE_URL)
+            years = re.findall(r'class="year-link" id="(\d+)"', html)
+            return sorted(set([int(year) for year in years]))
         except Exception as e:
             print(f"Error getting years: {type(e).__name__}: {e}")
             return []
 
-    def _fetch_year_data(self, year: int) -> List[Dict[str, any]]:
-        """Fetch film data for a specific year via the AJAX endpoint."""
+    def _fetch_year_data(self, year: int) -> Optional[List[Dict[str, any]]]:
+        """
+        Fetch film data for a specific year via the AJAX endpoint.
+        Returns None if the year is unchanged (incremental mode).
+        """
         url = f"{self.BASE_URL}?ajax=true&year={year}"
         try:
-            req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-            with urllib.request.urlopen(req, timeout=15) as resp:
-                raw = resp.read().decode("utf-8")
-                films = json.loads(raw)
+            raw = self._fetch(url)
+            if self._is_unchanged(f"year:{year}", raw):
+                return None
+            films = json.loads(raw)
 
             data = []
             for film in films:
@@ -336,6 +628,8 @@ class OscarScraper(Scraper):
 
         except Exception as e:
             print(f"Error fetching year {year}: {type(e).__name__}: {e}")
+            # No rows for this year → refetch it next time
+            self._fetched_fingerprints.pop(f"year:{year}", None)
             return []
 
     def get_all_oscar_data(self, base_url: str = None) -> List[Dict[str, any]]:
@@ -346,35 +640,72 @@ class OscarScraper(Scraper):
 
         years = self.get_years()  # 2010 through 2015
 
-        for year in years:
-            films = self._fetch_year_data(year)
-            all_data.extend(films)
-            print(f"Year {year}: {len(films)} films")
-            time.sleep(0.3)  # polite delay
+        # map() keeps results in year order regardless of completion order
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENCY) as pool:
+            for year, films in zip(years, pool.map(self._fetch_year_data, years)):
+                if films is None:
+                    self.units_skipped += 1
+                    print(f"Year {year}: unchanged → skipped")
+                else:
+                    self.units_refreshed += 1
+                    all_data.extend(films)
+                    print(f"Year {year}: {len(films)} films")
+                self._record_fingerprint(f"year:{year}")
 
         print(f"Total collected: {len(all_data)} films")
         return all_data
 
     def save_to_database(self, data: List[Dict[str, any]], job_id: str = None) -> None:
-        """Save Oscar data: create Film by title, then OscarWinnerFilm with film_id."""
+        """
+        Save Oscar data in one transaction: films are resolved by title in
+        bulk (recently seen titles straight from the id cache), then all
+        OscarWinnerFilm rows are upserted on (film, year) with a single
+        executemany.
+        """
         from app.models.films import Film, OscarWinnerFilm
 
+        if not data:
+            return
+
         with Session() as session:
-            for row in data:
-                film = (
-                    session.query(Film).filter(Film.title == row["title"]).one_or_none()
-                )
-                if not film:
-                    film = Film(title=row["title"])
-                    session.add(film)
-                    session.flush()
-                oscar = OscarWinnerFilm(
-                    film_id=film.id,
-                    year=row["year"],
-                    nominations=row["nominations"],
-                    awards=row["awards"],
-                    best_picture=row.get("best_picture", False),
-                    job_id=job_id,
+            if self._use_copy(session):
+                copy_oscar_winners(
+                    session,
+                    (
+                        (
+                            row["title"],
+                            row["year"],
+                            row["nominations"],
+                            row["awards"],
+                            row.get("best_picture", False),
+                        )
+                        for row in data
+                    ),
+                    job_id,
                 )
-                session.add(oscar)
+                session.commit()
+                return
+
+            cache = id_cache(session, Film.title)
+            film_ids = resolve_ids(
+                session, Film.title, (row["title"] for row in data), cache=cache
+            )
+            upsert_rows(
+                session,
+                OscarWinnerFilm,
+                [
+                    {
+                        "film_id": film_ids[row["title"]],
+                        "year": row["year"],
+                        "nominations": row["nominations"],
+                        "awards": row["awards"],
+                        "best_picture": row.get("best_picture", False),
+                        "job_id": job_id,
+                    }
+                    for row in data
+                ],
+                keys=("film_id", "year"),
+            )
             session.commit()
+            # Only ids of committed rows may be cached
+            cache.update(film_ids)
@@ -0,0 +1,155 @@
+"""
+On-disk HTTP cache with conditional revalidation (ETag / Last-Modified).
+
+Responses carrying validators are stored as ``<sha256(url)>.entry``: one line
+of JSON metadata (url, validators, encoding) followed by the body, written
+with a single ``os.replace`` so readers never pair a body with another
+response's validators. Later requests send ``If-None-Match`` /
+``If-Modified-Since`` and a ``304 Not Modified`` is answered from disk.
+The directory is kept under ``max_bytes`` by evicting least recently used
+entries (file mtime is bumped on every hit).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from app.config import HTTP_CACHE_DIR, HTTP_CACHE_ENABLED, HTTP_CACHE_MAX_MB
+
+ENTRY_SUFFIX = ".entry"
+
+
+class CacheStats:
+    """Hit/miss counters of one job (thread-safe)."""
+
+    def __init__(self):
+        self.hits = 0  # 304 → body served from cache
+        self.misses = 0  # full download
+        self._lock = threading.Lock()
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def __str__(self) -> str:
+        return f"hits={self.hits} misses={self.misses}"
+
+
+class CacheEntry:
+    def __init__(self, meta: Dict[str, Optional[str]], body: bytes):
+        self.etag = meta.get("etag")
+        self.last_modified = meta.get("last_modified")
+        self.encoding = meta.get("encoding") or "utf-8"
+        self.body = body
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(self.encoding, errors="replace")
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    def __init__(self, directory: str = HTTP_CACHE_DIR, max_bytes: int = 0):
+        self.directory = directory
+        self.max_bytes = max_bytes or HTTP_CACHE_MAX_MB * 1024 * 1024
+        self._lock = threading.Lock()
+
+    def _path(self, url: str) -> str:
+        name = hashlib.sha256(url.encode()).hexdigest() + ENTRY_SUFFIX
+        return os.path.join(self.directory, name)
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        try:
+            with open(self._path(url), "rb") as f:
+                meta = json.loads(f.readline())
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url:
+            return None
+        return CacheEntry(meta, body)
+
+    def touch(self, url: str) -> None:
+        """Mark the entry as recently used (LRU order = entry mtime)."""
+        try:
+            os.utime(self._path(url))
+        except OSError:
+            pass
+
+    def put(
+        self,
+        url: str,
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        encoding: Optional[str] = None,
+    ) -> None:
+        """Store a response; ignored without validators (nothing to revalidate)."""
+        if not (etag or last_modified):
+            return
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "encoding": encoding,
+        }
+        data = json.dumps(meta).encode() + b"\n" + body
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            self._write(self._path(url), data)
+            self._evict()
+
+    def _write(self, path: str, data: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _evict(self) -> None:
+        entries: List[Tuple[float, int, str]] = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith(ENTRY_SUFFIX):
+                continue
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, name))
+            total += st.st_size
+
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            total -= size
+
+
+_cache: Optional[HttpCache] = HttpCache() if HTTP_CACHE_ENABLED else None
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """Process-wide cache (None when HTTP_CACHE_ENABLED is off)."""
+    return _cache
@@ -0,0 +1,78 @@
+"""
+Pooled HTTP client shared by the scrapers.
+
+A single keep-alive ``requests.Session`` is created per process, so every
+page/year request reuses the same TCP + TLS connections instead of paying a
+new handshake per request. Requests are paced by the per-host rate limiter
+and revalidated against the on-disk HTTP cache when it is enabled.
+"""
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.crawlers.http_cache import CacheStats, get_http_cache
+from app.crawlers.ratelimit import get_limiter
+
+USER_AGENT = "Mozilla/5.0"
+DEFAULT_TIMEOUT = 15
+
+# Connections kept alive per host (upper bound for concurrent requests)
+POOL_MAXSIZE = 16
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Return the process-wide pooled session (created on first use)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers["User-Agent"] = USER_AGENT
+            _session = session
+        return _session
+
+
+def fetch_text(
+    url: str,
+    timeout: float = DEFAULT_TIMEOUT,
+    stats: Optional[CacheStats] = None,
+) -> str:
+    """
+    GET ``url`` through the pooled session and return the decoded body.
+
+    A cached copy is revalidated with ``If-None-Match``/``If-Modified-Since``;
+    on ``304`` the cached body is returned. Hits/misses go to ``stats``.
+    """
+    cache = get_http_cache()
+    entry = cache.get(url) if cache is not None else None
+    headers = entry.validators() if entry is not None else {}
+
+    with get_limiter(url):
+        resp = get_http_session().get(url, timeout=timeout, headers=headers)
+
+    if resp.status_code == 304 and entry is not None:
+        cache.touch(url)
+        if stats is not None:
+            stats.record_hit()
+        return entry.text
+
+    resp.raise_for_status()
+    if stats is not None:
+        stats.record_miss()  # full download, cache or not
+    if cache is not None:
+        cache.put(
+            url,
+            resp.content,
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+            encoding=resp.encoding,
+        )
+    return resp.text
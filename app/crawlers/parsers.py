@@ -0,0 +1,69 @@
+"""
+Browser-free HTML parsing helpers (stdlib ``html.parser``).
+
+Used by the HTTP engine of the scrapers to read server-rendered tables
+without starting a WebDriver.
+"""
+
+import re
+from html.parser import HTMLParser
+from typing import List, Optional
+
+
+class TableRowsParser(HTMLParser):
+    """
+    Collect the ``<td>`` texts of every ``<tr>`` inside the element with
+    ``id=container_id``. ``rows`` stays ``None`` if the container is missing.
+    """
+
+    def __init__(self, container_id: str):
+        super().__init__(convert_charrefs=True)
+        self.container_id = container_id
+        self.rows: Optional[List[List[str]]] = None
+        self._container_tag: Optional[str] = None
+        self._depth = 0  # nesting of container_tag while inside the container
+        self._cell: Optional[List[str]] = None
+
+    def handle_starttag(self, tag, attrs):
+        if self._container_tag is None:
+            if dict(attrs).get("id") == self.container_id:
+                self._container_tag = tag
+                self._depth = 1
+                self.rows = []
+            return
+
+        if self._depth == 0:
+            return
+        if tag == self._container_tag:
+            self._depth += 1
+        elif tag == "tr":
+            self.rows.append([])
+        elif tag == "td" and self.rows:
+            self._cell = []
+
+    def handle_endtag(self, tag):
+        if self._depth == 0:
+            return
+        if tag == self._container_tag:
+            self._depth -= 1
+        elif tag == "td" and self._cell is not None:
+            self.rows[-1].append(" ".join("".join(self._cell).split()))
+            self._cell = None
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+
+def parse_table_rows(html: str, container_id: str) -> Optional[List[List[str]]]:
+    """Return the cell texts of each row under ``#container_id`` (None if absent)."""
+    parser = TableRowsParser(container_id)
+    parser.feed(html)
+    parser.close()
+    return parser.rows
+
+
+def parse_page_numbers(html: str, page_param: str) -> List[int]:
+    """Return the sorted, unique page numbers linked as ``?page_param=N``."""
+    numbers = re.findall(rf"[?&]{re.escape(page_param)}=(\d+)", html)
+    return sorted({int(n) for n in numbers})
@@ -0,0 +1,153 @@
+"""
+Writer stage of the fetch → parse → persist crawl pipeline.
+
+Scrapers yield parsed pages and hand them to a ``PageWriter``, which persists
+them on its own thread while the next page is being fetched, so network and
+database latency overlap instead of adding up. The queue between the stages
+is bounded: when the database falls behind, ``put`` blocks the crawler
+(back-pressure) and at most ``max_pages`` parsed pages are held in memory.
+Pages waiting in the queue are written together in one batch.
+
+``ordered_map`` is the fetch-side counterpart: a ``map`` over an executor that
+keeps only a window of results pending, so a large crawl isn't fetched ahead
+of the consumer without bound.
+"""
+
+import itertools
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future
+from typing import Callable, Deque, Generic, Iterable, Iterator, List, Optional, TypeVar
+
+from app.config import SCRAPER_WRITE_BATCH_PAGES, SCRAPER_WRITE_QUEUE_PAGES
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_DONE = object()  # end-of-stream sentinel
+
+
+class PageWriter(Generic[T]):
+    """
+    Persist pages of rows on a background thread.
+
+    Usage:
+        with PageWriter(lambda rows: save(rows, job_id)) as writer:
+            for rows in pages:
+                writer.put(rows)
+
+    Leaving the block normally flushes the queue and re-raises the first
+    error of the writer thread; ``put`` also raises it, so a failing database
+    stops the crawl early. When the block exits with an exception, queued
+    pages are dropped.
+    """
+
+    def __init__(
+        self,
+        save: Callable[[List[T]], None],
+        max_pages: int = SCRAPER_WRITE_QUEUE_PAGES,
+        batch_pages: int = SCRAPER_WRITE_BATCH_PAGES,
+    ):
+        self._save = save
+        self.batch_pages = max(1, batch_pages)
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, max_pages))
+        self._error: Optional[BaseException] = None
+        self._aborted = False
+        self.pages_written = 0
+        self.batches_written = 0
+        self._thread = threading.Thread(
+            target=self._run, name="page-writer", daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            self._aborted = True
+        self.close()
+
+    def put(self, rows: List[T]) -> None:
+        """Queue one page (blocks while the queue is full)."""
+        while True:
+            self._raise_error()
+            try:
+                self._queue.put(rows, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def close(self) -> None:
+        """Flush queued pages, stop the thread and re-raise a writer error."""
+        if self._thread.is_alive():
+            # The writer may have died with a full queue → don't block forever
+            while self._thread.is_alive():
+                try:
+                    self._queue.put(_DONE, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            self._thread.join()
+        if not self._aborted:
+            self._raise_error()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _DONE:
+                return
+            batch = [item]
+            done = False
+            # Coalesce pages that piled up while the previous batch was saved
+            while len(batch) < self.batch_pages:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _DONE:
+                    done = True
+                    break
+                batch.append(item)
+
+            if not self._aborted:
+                try:
+                    self._save([row for page in batch for row in page])
+                except BaseException as e:
+                    self._error = e
+                    return
+                self.pages_written += len(batch)
+                self.batches_written += 1
+            if done:
+                return
+
+
+def ordered_map(
+    executor: Executor,
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    window: int,
+) -> Iterator[R]:
+    """
+    ``executor.map(fn, items)`` with at most ``window`` calls submitted ahead
+    of the consumer. Results come in input order; calls not yet started are
+    cancelled when the iterator is closed early.
+    """
+    items = iter(items)
+    pending: Deque[Future] = deque(
+        executor.submit(fn, item) for item in itertools.islice(items, max(1, window))
+    )
+    try:
+        while pending:
+            future = pending.popleft()
+            for item in itertools.islice(items, 1):
+                pending.append(executor.submit(fn, item))
+            yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
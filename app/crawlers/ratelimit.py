@@ -0,0 +1,103 @@
+"""
+Per-host token-bucket rate limiting for scraper requests (thread-safe).
+
+Replaces fixed ``time.sleep`` politeness delays: requests go out immediately
+while tokens are available and only wait when the configured rate is exceeded.
+Every HTTP request and Selenium navigation of the scrapers goes through the
+limiter of its host (``get_limiter``), configured in ``SCRAPER_URLS``.
+"""
+
+import threading
+import time
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+from app.config import SCRAPER_DEFAULT_RATE_LIMIT, SCRAPER_URLS
+
+
+class RateLimiter:
+    """
+    Allow ``rate`` requests/sec on average, with bursts of up to ``burst``,
+    and at most ``max_concurrency`` requests in flight (``with limiter:``).
+
+    ``rate <= 0`` / ``max_concurrency <= 0`` disable the respective limit.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, max_concurrency: int = 0):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_concurrency = max_concurrency
+        self._slots: Optional[threading.BoundedSemaphore] = (
+            threading.BoundedSemaphore(max_concurrency) if max_concurrency > 0 else None
+        )
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        if self._slots is not None:
+            self._slots.acquire()
+        try:
+            self.acquire()
+        except BaseException:
+            self.__exit__(None, None, None)
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._slots is not None:
+            self._slots.release()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def _strictest(values: Iterable[float]) -> float:
+    """Smallest positive limit (0 = unlimited when nobody sets one)."""
+    positive = [v for v in values if v > 0]
+    return min(positive) if positive else 0
+
+
+def host_limits(host: str) -> Dict[str, float]:
+    """
+    Limits for ``host`` from the ``SCRAPER_URLS`` entries served by it.
+    Entries sharing a host share one limiter with the strictest settings.
+    """
+    configs = [
+        cfg for cfg in SCRAPER_URLS.values() if urlparse(cfg["url"]).hostname == host
+    ] or [SCRAPER_DEFAULT_RATE_LIMIT]
+    return {
+        "rate": _strictest(cfg.get("rate", 0) for cfg in configs),
+        "burst": int(min(cfg.get("burst", 1) for cfg in configs)),
+        "max_concurrency": int(
+            _strictest(cfg.get("max_concurrency", 0) for cfg in configs)
+        ),
+    }
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(url: str) -> RateLimiter:
+    """Return the process-wide limiter for the host of ``url``."""
+    host = urlparse(url).hostname or ""
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = _limiters[host] = RateLimiter(**host_limits(host))
+        return limiter
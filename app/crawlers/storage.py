@@ -0,0 +1,307 @@
+"""
+Set-based persistence helpers for scraped rows.
+
+Instead of one SELECT (and INSERT) per scraped row, natural keys such as team
+names are resolved with a single ``IN`` query, the missing ones are created
+with one ``INSERT ... ON CONFLICT DO NOTHING RETURNING`` and fact rows are
+upserted on their natural key with one executemany (``upsert_rows``), all in
+the caller's transaction. Keys resolved
+before can be served from a per-process LRU (``id_cache``), skipping the
+lookup entirely.
+
+For very large batches the ``copy`` ingestion mode skips statement overhead
+entirely: rows are streamed with ``COPY FROM STDIN`` (psycopg2
+``copy_expert``) into a temporary staging table and merged into the real
+tables with set-based ``INSERT ... SELECT ... ON CONFLICT`` statements. It
+needs PostgreSQL with psycopg2; ``supports_copy`` tells callers when to use
+the ORM path.
+"""
+
+import csv
+import io
+import threading
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import insert, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session as SessionType
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.sql.dml import Insert
+
+from app.cache import LRUCache
+from app.config import ID_CACHE_SIZE
+
+
+def dialect_insert(session: SessionType, model) -> Insert:
+    """INSERT for ``model`` with ``on_conflict_*`` support where the dialect has it."""
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+        return pg_insert(model)
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+        return sqlite_insert(model)
+    return insert(model)
+
+
+_id_caches: "weakref.WeakKeyDictionary[Engine, Dict[str, LRUCache]]" = (
+    weakref.WeakKeyDictionary()
+)
+_id_caches_lock = threading.Lock()
+
+
+def id_cache(session: SessionType, key: InstrumentedAttribute) -> LRUCache:
+    """
+    Process-wide ``key`` value → id cache for the session's database (one per
+    engine, so ids of different databases never mix).
+
+    Only put ids in it after the transaction that resolved them committed:
+    ids of rolled-back inserts would point to nothing.
+    """
+    engine = session.get_bind()
+    engine = getattr(engine, "engine", engine)  # session bound to a Connection
+    with _id_caches_lock:
+        caches = _id_caches.setdefault(engine, {})
+        name = f"{key.class_.__name__}.{key.key}"
+        if name not in caches:
+            caches[name] = LRUCache(ID_CACHE_SIZE)
+        return caches[name]
+
+
+def resolve_ids(
+    session: SessionType,
+    key: InstrumentedAttribute,
+    values: Iterable[str],
+    cache: Optional[LRUCache] = None,
+) -> Dict[str, int]:
+    """
+    Map each natural-key value of ``key`` (e.g. ``HockeyTeam.name``) to its row
+    id, inserting rows for the missing ones. Three statements at most, none
+    when every value is in ``cache``.
+    """
+    model = key.class_
+    wanted = set(values)
+    if not wanted:
+        return {}
+
+    ids: Dict[str, int] = cache.get_many(wanted) if cache is not None else {}
+    lookup = wanted - ids.keys()
+    if lookup:
+        ids.update(session.execute(select(key, model.id).where(key.in_(lookup))).all())
+    missing = sorted(wanted - ids.keys())
+    if missing:
+        stmt = dialect_insert(session, model).values([{key.key: v} for v in missing])
+        if hasattr(stmt, "on_conflict_do_nothing"):
+            stmt = stmt.on_conflict_do_nothing()
+        ids.update(session.execute(stmt.returning(key, model.id)).all())
+
+        # Rows inserted concurrently by another worker aren't RETURNed
+        raced = [v for v in missing if v not in ids]
+        if raced:
+            ids.update(
+                session.execute(select(key, model.id).where(key.in_(raced))).all()
+            )
+    return ids
+
+
+def upsert_rows(
+    session: SessionType,
+    model,
+    rows: List[Dict[str, Any]],
+    keys: Sequence[str],
+) -> None:
+    """
+    ``INSERT ... ON CONFLICT (keys) DO UPDATE`` of ``rows`` (one executemany).
+    Rows repeating a key within the batch are collapsed, the last one wins.
+    """
+    if not rows:
+        return
+    rows = list({tuple(row[k] for k in keys): row for row in rows}.values())
+    stmt = dialect_insert(session, model)
+    if hasattr(stmt, "on_conflict_do_update"):
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(keys),
+            set_={col: stmt.excluded[col] for col in rows[0] if col not in keys},
+        )
+    session.execute(stmt, rows)
+
+
+# Ingestion backends selectable per job ("copy" falls back to "orm")
+INGEST_MODES = ("orm", "copy")
+
+
+def supports_copy(session: SessionType) -> bool:
+    dialect = session.get_bind().dialect
+    return dialect.name == "postgresql" and dialect.driver == "psycopg2"
+
+
+class _CsvStream(io.TextIOBase):
+    """Read-only file over an iterator of rows, encoded as CSV on demand."""
+
+    def __init__(self, rows: Iterable[Sequence[Any]]):
+        self._rows = iter(rows)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\n")
+        self._pending = ""
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> str:
+        while size is None or size < 0 or len(self._pending) < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            # None → unquoted empty field → NULL in COPY's CSV format
+            self._writer.writerow(row)
+            self._pending += self._buffer.getvalue()
+            self._buffer.seek(0)
+            self._buffer.truncate()
+        if size is None or size < 0:
+            size = len(self._pending)
+        chunk, self._pending = self._pending[:size], self._pending[size:]
+        return chunk
+
+
+def copy_rows(
+    session: SessionType,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+) -> None:
+    """Stream ``rows`` into ``table`` with ``COPY FROM STDIN`` (CSV)."""
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+            _CsvStream(rows),
+        )
+    finally:
+        cursor.close()
+
+
+def _stage(
+    session: SessionType,
+    name: str,
+    columns: Dict[str, str],
+    rows: Iterable[Sequence[Any]],
+) -> None:
+    """Create the temp table ``name`` (dropped on commit) and COPY ``rows`` in."""
+    ddl = ", ".join(f"{col} {sql_type}" for col, sql_type in columns.items())
+    session.execute(text(f"CREATE TEMP TABLE {name} ({ddl}) ON COMMIT DROP"))
+    copy_rows(session, name, list(columns), rows)
+
+
+def copy_hockey_historic(
+    session: SessionType,
+    rows: Iterable[Sequence[Any]],
+    job_id: Optional[str] = None,
+) -> None:
+    """
+    Ingest ``(name, year, wins, losses, losses_ot, wins_percentage, goals_for,
+    goals_against, goal_difference)`` tuples: COPY to staging, create the
+    missing teams, then upsert the historic rows on (team, year); for a key
+    repeated in the batch the last row wins.
+    """
+    _stage(
+        session,
+        "hockey_stage",
+        {
+            "pos": "bigint",
+            "name": "varchar(255)",
+            "year": "integer",
+            "wins": "integer",
+            "losses": "integer",
+            "losses_ot": "integer",
+            "wins_percentage": "double precision",
+            "goals_for": "double precision",
+            "goals_against": "double precision",
+            "goal_difference": "double precision",
+        },
+        ((pos, *row) for pos, row in enumerate(rows)),
+    )
+    session.execute(text("""
+            INSERT INTO hockey_team (name)
+            SELECT DISTINCT name FROM hockey_stage
+            ON CONFLICT (name) DO NOTHING
+            """))
+    session.execute(
+        text("""
+            INSERT INTO hockey_team_historic (
+                team_id, year, wins, losses, losses_ot, wins_percentage,
+                goals_for, goals_against, goal_difference, job_id
+            )
+            SELECT
+                t.id, s.year, s.wins, s.losses, s.losses_ot, s.wins_percentage,
+                s.goals_for, s.goals_against, s.goal_difference, :job_id
+            FROM (
+                SELECT DISTINCT ON (name, year) * FROM hockey_stage
+                ORDER BY name, year, pos DESC
+            ) s
+            JOIN hockey_team t ON t.name = s.name
+            ORDER BY s.pos
+            ON CONFLICT (team_id, year) DO UPDATE SET
+                wins = EXCLUDED.wins,
+                losses = EXCLUDED.losses,
+                losses_ot = EXCLUDED.losses_ot,
+                wins_percentage = EXCLUDED.wins_percentage,
+                goals_for = EXCLUDED.goals_for,
+                goals_against = EXCLUDED.goals_against,
+                goal_difference = EXCLUDED.goal_difference,
+                job_id = EXCLUDED.job_id
+            """),
+        {"job_id": job_id},
+    )
+
+
+def copy_oscar_winners(
+    session: SessionType,
+    rows: Iterable[Sequence[Any]],
+    job_id: Optional[str] = None,
+) -> None:
+    """
+    Ingest ``(title, year, nominations, awards, best_picture)`` tuples: COPY to
+    staging, create the missing films, then upsert the Oscar rows on
+    (film, year); for a key repeated in the batch the last row wins.
+    """
+    _stage(
+        session,
+        "oscar_stage",
+        {
+            "pos": "bigint",
+            "title": "varchar(255)",
+            "year": "integer",
+            "nominations": "integer",
+            "awards": "integer",
+            "best_picture": "boolean",
+        },
+        ((pos, *row) for pos, row in enumerate(rows)),
+    )
+    session.execute(text("""
+            INSERT INTO films (title)
+            SELECT DISTINCT title FROM oscar_stage
+            ON CONFLICT (title) DO NOTHING
+            """))
+    session.execute(
+        text("""
+            INSERT INTO oscar_winner_films (
+                film_id, year, nominations, awards, best_picture, job_id
+            )
+            SELECT f.id, s.year, s.nominations, s.awards, s.best_picture, :job_id
+            FROM (
+                SELECT DISTINCT ON (title, year) * FROM oscar_stage
+                ORDER BY title, year, pos DESC
+            ) s
+            JOIN films f ON f.title = s.title
+            ORDER BY s.pos
+            ON CONFLICT (film_id, year) DO UPDATE SET
+                nominations = EXCLUDED.nominations,
+                awards = EXCLUDED.awards,
+                best_picture = EXCLUDED.best_picture,
+                job_id = EXCLUDED.job_id
+            """),
+        {"job_id": job_id},
+    )
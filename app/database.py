@@ -1,9 +1,21 @@
 from urllib.parse import urlparse, urlunparse
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import (
+    UniqueConstraint,
+    create_engine,
+    delete,
+    func,
+    inspect,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.schema import AddConstraint, CreateColumn
 
-from app.config import DATABASE_URL
+from app.config import DATABASE_URL, DB_MAX_OVERFLOW, DB_POOL_SIZE
 
 # Default DB name to create if not exist (from DATABASE_URL)
 DATABASE_NAME = "rpa"
@@ -35,17 +47,165 @@ def ensure_database_exists() -> None:
     engine.dispose()
 
 
+# Async drivers for the sync URL schemes of DATABASE_URL
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+
+def async_database_url(url: str) -> str:
+    """``DATABASE_URL`` with its driver swapped for the asyncio one."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    driver = ASYNC_DRIVERS.get(backend)
+    if driver is None:
+        raise ValueError(f"No async driver for database backend {backend!r}")
+    return parsed.set(drivername=f"{backend}+{driver}").render_as_string(
+        hide_password=False
+    )
+
+
 engine = create_engine(
     DATABASE_URL,
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
 )
 
 Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# API read path: asyncpg engine on the event loop (no threadpool hop per query)
+async_engine = create_async_engine(
+    async_database_url(DATABASE_URL),
+    pool_pre_ping=True,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+)
+
+AsyncSession = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
 
+def ensure_indexes(bind) -> None:
+    """
+    Create indexes declared on the models that are missing in the database.
+    ``create_all`` skips existing tables, so indexes added to a model later
+    would otherwise never reach an existing database.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
+
+
+def ensure_columns(bind) -> None:
+    """
+    Add columns declared on the models that are missing in existing tables
+    (``create_all`` doesn't alter tables). New columns need to be nullable
+    or carry a ``server_default``.
+    """
+    inspector = inspect(bind)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        missing = [column for column in table.columns if column.name not in existing]
+        if not missing:
+            continue
+        # IF NOT EXISTS: another process may be upgrading concurrently
+        if_not_exists = "IF NOT EXISTS " if bind.dialect.name == "postgresql" else ""
+        with bind.begin() as conn:
+            for column in missing:
+                ddl = CreateColumn(column).compile(dialect=bind.dialect)
+                conn.execute(
+                    text(f"ALTER TABLE {table.name} ADD COLUMN {if_not_exists}{ddl}")
+                )
+
+
+# pg_advisory_xact_lock key of the one-off schema upgrades: every container
+# runs init_db on start, so concurrent runs must queue up
+SCHEMA_UPGRADE_LOCK_ID = 7_016_001
+
+
+def ensure_unique_constraints(bind) -> None:
+    """
+    Add unique constraints declared on the models that are missing in the
+    database (upserts' ON CONFLICT targets need them). Rows duplicated while
+    the constraint was missing are merged first: the latest id is kept and
+    foreign keys to the others are repointed to it.
+
+    Destructive one-off migration: run from ``init_db`` only. On PostgreSQL
+    it holds an advisory lock for its whole transaction; a run that got the
+    lock after another one finds the constraints there and does nothing.
+    """
+    with bind.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            conn.execute(select(func.pg_advisory_xact_lock(SCHEMA_UPGRADE_LOCK_ID)))
+        inspector = inspect(conn)  # after the lock: sees the winner's changes
+        for table in Base.metadata.sorted_tables:  # parents first
+            if not inspector.has_table(table.name):
+                continue
+            existing = {
+                frozenset(uc["column_names"])
+                for uc in inspector.get_unique_constraints(table.name)
+            } | {
+                frozenset(ix["column_names"])
+                for ix in inspector.get_indexes(table.name)
+                if ix["unique"]
+            }
+            for constraint in table.constraints:
+                if not isinstance(constraint, UniqueConstraint):
+                    continue
+                columns = [column.name for column in constraint.columns]
+                if frozenset(columns) in existing:
+                    continue
+                _merge_duplicates(conn, table, list(constraint.columns))
+                if conn.dialect.name == "sqlite":
+                    # No ALTER TABLE … ADD CONSTRAINT; a unique index is
+                    # what SQLite builds for one anyway
+                    name = constraint.name or f"uq_{table.name}_{'_'.join(columns)}"
+                    conn.execute(
+                        text(
+                            f"CREATE UNIQUE INDEX {name} "
+                            f"ON {table.name} ({', '.join(columns)})"
+                        )
+                    )
+                else:
+                    conn.execute(AddConstraint(constraint))
+                print(f"Added unique constraint on {table.name} ({', '.join(columns)})")
+
+
+def _merge_duplicates(conn, table, key_columns) -> None:
+    """
+    Delete rows of ``table`` sharing ``key_columns``, keeping the latest id,
+    in set-based statements (no rows loaded into Python).
+    """
+    ranked = select(
+        table.c.id,
+        func.max(table.c.id).over(partition_by=key_columns).label("keep_id"),
+        func.row_number()
+        .over(partition_by=key_columns, order_by=table.c.id.desc())
+        .label("rn"),
+    ).subquery("ranked")
+    duplicates = (
+        select(ranked.c.id, ranked.c.keep_id).where(ranked.c.rn > 1).subquery("dups")
+    )
+
+    # UPDATE … FROM: children of dropped rows move to the kept one
+    for child in Base.metadata.sorted_tables:
+        for fk in child.foreign_keys:
+            if fk.column is table.c.id:
+                conn.execute(
+                    update(child)
+                    .where(fk.parent == duplicates.c.id)
+                    .values({fk.parent.name: duplicates.c.keep_id})
+                )
+    if conn.dialect.name == "postgresql":
+        stmt = delete(table).where(table.c.id == duplicates.c.id)  # DELETE … USING
+    else:
+        stmt = delete(table).where(table.c.id.in_(select(duplicates.c.id)))
+    deleted = conn.execute(stmt).rowcount
+    if deleted:
+        print(f"Merged {deleted} duplicate rows of {table.name}")
+
+
 def get_session():
     """Yield a DB session (context manager). Use with: with get_session() as session:"""
     session = Session()
@@ -57,3 +217,14 @@ def get_session():
         raise
     finally:
         session.close()
+
+
+async def get_async_session():
+    """FastAPI dependency: yield an ``AsyncSession`` on the async engine."""
+    async with AsyncSession() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
@@ -0,0 +1,59 @@
+"""
+Streaming NDJSON / CSV export of result queries.
+
+Rows are read through a server-side cursor (``yield_per`` → psycopg2 named
+cursor) and encoded in chunks of ``EXPORT_BATCH_SIZE`` rows, so memory stays
+constant whatever the table size. The generator owns its session: a
+``StreamingResponse`` body is produced after the request dependencies
+(including the request's DB session) may already have been closed.
+"""
+
+import csv
+import io
+import json
+from typing import Dict, Iterator, Literal
+
+from sqlalchemy import Select
+from sqlalchemy.orm import Session as DBSession
+
+from app.config import EXPORT_BATCH_SIZE
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MEDIA_TYPES: Dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def stream_rows(
+    bind,
+    stmt: Select,
+    fmt: ExportFormat = "ndjson",
+    batch_size: int = 0,
+) -> Iterator[str]:
+    """
+    Yield the rows of ``stmt`` encoded as ``fmt``, one chunk per
+    ``batch_size`` rows. The statement must select columns (not entities).
+    """
+    batch_size = batch_size or EXPORT_BATCH_SIZE
+    with DBSession(bind=bind) as session:
+        rows = session.execute(stmt.execution_options(yield_per=batch_size))
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n") if fmt == "csv" else None
+        if writer is not None:
+            writer.writerow(rows.keys())
+
+        for count, row in enumerate(rows, start=1):
+            if writer is not None:
+                writer.writerow(row)
+            else:
+                buffer.write(json.dumps(row._asdict()))
+                buffer.write("\n")
+            if count % batch_size == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue()
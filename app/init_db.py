@@ -4,7 +4,14 @@ Script para inicializar o banco de dados
 Cria as tabelas necessárias
 """
 
-from app.database import Base, engine, ensure_database_exists
+from app.database import (
+    Base,
+    engine,
+    ensure_columns,
+    ensure_database_exists,
+    ensure_indexes,
+    ensure_unique_constraints,
+)
 
 
 def init_db():
@@ -21,6 +28,9 @@ def init_db():
 
     # Create all tables
     Base.metadata.create_all(bind=engine)
+    ensure_columns(engine)
+    ensure_indexes(engine)
+    ensure_unique_constraints(engine)
     print("✅ Tabelas criadas/verificadas")
     print("✅ Banco de dados pronto!")
 
@@ -1,18 +1,48 @@
+import gzip
+import hashlib
 import uuid
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 
-from fastapi import Depends, FastAPI, HTTPException
-from pydantic import BaseModel, ConfigDict
+from fastapi import Depends, FastAPI, Header, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import Row, Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session as DBSession
-from sqlalchemy.orm import joinedload
-
-from app.database import Base, get_session
+from typing_extensions import TypedDict
+
+from app.cache import LRUCache
+from app.config import RESULTS_CACHE_SIZE, RESULTS_CACHE_TTL, RESULTS_MAX_AGE
+from app.database import (
+    Base,
+    ensure_columns,
+    ensure_indexes,
+    get_async_session,
+    get_session,
+)
+from app.export import MEDIA_TYPES, ExportFormat, stream_rows
+from app.models import fingerprints  # noqa: F401 (table for create_all)
 from app.models.films import OscarWinnerFilm
 from app.models.hockey_teams import HockeyTeamHistoric
 from app.models.jobs import Job, JobStatus, JobType
+from app.models.snapshots import JobSnapshot
+from app.pagination import decode_cursor, next_cursor, page_size, split_page
 from app.queue import publish_job, publish_jobs
+from app.responses import (
+    FastJSONResponse,
+    dumps,
+    encoded_response,
+    json_response,
+    validate,
+)
+from app.results import (
+    film_select,
+    hockey_select,
+    job_results_payload,
+    job_results_select,
+)
 
 
 @asynccontextmanager
@@ -21,10 +51,14 @@ async def lifespan(app: FastAPI):
     Create DB tables on startup (not at import time,
     so tests can import app without connecting).
     """
+    from app.database import async_engine
     from app.database import engine as db_engine
 
     Base.metadata.create_all(bind=db_engine)
+    ensure_columns(db_engine)
+    ensure_indexes(db_engine)
     yield
+    await async_engine.dispose()
 
 
 app = FastAPI(
@@ -32,30 +66,36 @@ app = FastAPI(
     description="API para coleta assíncrona de dados via web scraping",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 
+# DB ingestion backend of a crawl job (see app.crawlers.storage)
+IngestMode = Literal["orm", "copy"]
+
+
 # Pydantic schemas
 class JobCreate(BaseModel):
     job_type: str
 
 
-class JobResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
-
+# Response rows: TypedDicts, validated into plain dicts (see app.responses)
+class JobResponse(TypedDict):
     job_id: str
     job_type: str
     status: str
     created_at: datetime
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
-    error_message: Optional[str] = None
-    results_count: int = 0
-
+    started_at: Optional[datetime]
+    completed_at: Optional[datetime]
+    error_message: Optional[str]
+    results_count: int
+    units_skipped: int
+    units_refreshed: int
+    http_cache_hits: int
+    http_cache_misses: int
 
-class HockeyTeamResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
 
+class HockeyTeamResponse(TypedDict):
     id: int
     name: str
     year: int
@@ -68,9 +108,7 @@ class HockeyTeamResponse(BaseModel):
     goal_difference: float
 
 
-class FilmResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
-
+class FilmResponse(TypedDict):
     id: int
     title: str
     year: int
@@ -79,9 +117,113 @@ class FilmResponse(BaseModel):
     best_picture: bool
 
 
+def _job_response(job: Job) -> JobResponse:
+    return JobResponse(
+        job_id=job.job_id,
+        job_type=job.job_type.value,
+        status=job.status.value,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        completed_at=job.completed_at,
+        error_message=job.error_message,
+        results_count=job.results_count,
+        units_skipped=job.units_skipped or 0,
+        units_refreshed=job.units_refreshed or 0,
+        http_cache_hits=job.http_cache_hits or 0,
+        http_cache_misses=job.http_cache_misses or 0,
+    )
+
+
+def _job_etag(job: Job) -> str:
+    """
+    Strong ETag of a job's state, (job_id, status, completed_at,
+    results_count): the job's status body and results only change with it.
+    """
+    completed_at = job.completed_at.isoformat() if job.completed_at else ""
+    raw = f"{job.job_id}:{job.status.value}:{completed_at}:{job.results_count}"
+    return _body_etag(raw.encode())
+
+
+def _body_etag(body: bytes, suffix: str = "") -> str:
+    """
+    Strong ETag of the exact bytes of a response body; ``suffix`` tells apart
+    the encodings of one body (each needs its own strong ETag).
+    """
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + suffix + '"'
+
+
+def _not_modified(
+    etag: str,
+    if_none_match: Optional[str],
+    response: Response,
+    cache_control: str,
+    vary: Optional[str] = None,
+) -> Optional[Response]:
+    """
+    Set ``etag``, ``cache_control`` (and ``vary``) on ``response``; return a
+    304 to send instead when ``If-None-Match`` already names that ETag.
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if vary:
+        headers["Vary"] = vary
+    response.headers.update(headers)
+    if if_none_match:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        if "*" in tags or etag in (tag.removeprefix("W/") for tag in tags):
+            return Response(status_code=304, headers=headers)
+    return None
+
+
+# Validated result list type per job type
+_RESULT_TYPES = {
+    JobType.HOCKEY: List[HockeyTeamResponse],
+    JobType.OSCAR: List[FilmResponse],
+}
+
+
+def _results(job_type: JobType, rows: List[Row]) -> list:
+    return validate(_RESULT_TYPES[job_type], [row._mapping for row in rows])
+
+
+# Result caches (per API process). Entries are versioned with the results
+# generation read from the DB, so a job completing in any worker invalidates
+# them; the listings also expire after RESULTS_CACHE_TTL seconds, bounding the
+# staleness of rows written page by page by a running job.
+_job_results_cache: LRUCache = LRUCache(RESULTS_CACHE_SIZE)
+_listing_cache: LRUCache = LRUCache(RESULTS_CACHE_SIZE, ttl=RESULTS_CACHE_TTL)
+
+
+def _generation_columns() -> tuple:
+    """
+    Results generation: (latest job completion, number of running jobs).
+    Result rows only change while a job runs (its upserts can also take over
+    rows of older jobs) and every job end bumps ``completed_at``. Uncorrelated
+    scalar subqueries, each served by its own index on ``jobs``.
+    """
+    return (
+        select(func.max(Job.completed_at)).correlate(None).scalar_subquery(),
+        select(func.count())
+        .select_from(Job)
+        .where(Job.status == JobStatus.RUNNING)
+        .correlate(None)
+        .scalar_subquery(),
+    )
+
+
+async def _results_generation(db: AsyncSession) -> tuple:
+    return tuple((await db.execute(select(*_generation_columns()))).one())
+
+
+def _job_message(job_id: str, job_type: str, **options) -> dict:
+    """Queue message; options left as None fall back to the worker's defaults."""
+    message = {"job_id": job_id, "job_type": job_type}
+    message.update({k: v for k, v in options.items() if v is not None})
+    return message
+
+
 # Root endpoints
 @app.get("/")
-def root():
+async def root():
     return {
         "status": "ok",
         "message": "RPA Crawler API",
@@ -90,18 +232,33 @@ def root():
             "crawl": ["/crawl/hockey", "/crawl/oscar", "/crawl/all"],
             "jobs": ["/jobs", "/jobs/{job_id}", "/jobs/{job_id}/results"],
             "results": ["/results/hockey", "/results/oscar"],
+            "export": ["/export/hockey", "/export/oscar", "/jobs/{job_id}/export"],
+            "metrics": ["/metrics/cache"],
         },
     }
 
 
 @app.get("/health")
-def health():
+async def health():
     return {"status": "healthy"}
 
 
+@app.get("/metrics/cache")
+async def cache_metrics():
+    """Métricas dos caches de resultados deste processo (hits, misses, evictions)"""
+    return {
+        "job_results": _job_results_cache.stats(),
+        "results": _listing_cache.stats(),
+    }
+
+
 # Crawl endpoints (async job creation)
 @app.post("/crawl/hockey", response_model=JobResponse)
-def crawl_hockey(db: DBSession = Depends(get_session)):
+def crawl_hockey(
+    incremental: Optional[bool] = None,
+    ingest: Optional[IngestMode] = None,
+    db: DBSession = Depends(get_session),
+):
     """Agenda coleta do Hockey (retorna job_id)"""
     job_id = str(uuid.uuid4())
 
@@ -112,22 +269,17 @@ def crawl_hockey(db: DBSession = Depends(get_session)):
     db.refresh(job)
 
     # Publish to queue
-    publish_job({"job_id": job_id, "job_type": "hockey"})
+    publish_job(_job_message(job_id, "hockey", incremental=incremental, ingest=ingest))
 
-    return JobResponse(
-        job_id=job.job_id,
-        job_type=job.job_type.value,
-        status=job.status.value,
-        created_at=job.created_at,
-        started_at=job.started_at,
-        completed_at=job.completed_at,
-        error_message=job.error_message,
-        results_count=job.results_count,
-    )
+    return _job_response(job)
 
 
 @app.post("/crawl/oscar", response_model=JobResponse)
-def crawl_oscar(db: DBSession = Depends(get_session)):
+def crawl_oscar(
+    incremental: Optional[bool] = None,
+    ingest: Optional[IngestMode] = None,
+    db: DBSession = Depends(get_session),
+):
     """Agenda coleta do Oscar (retorna job_id)"""
     job_id = str(uuid.uuid4())
 
@@ -138,22 +290,17 @@ def crawl_oscar(db: DBSession = Depends(get_session)):
     db.refresh(job)
 
     # Publish to queue
-    publish_job({"job_id": job_id, "job_type": "oscar"})
+    publish_job(_job_message(job_id, "oscar", incremental=incremental, ingest=ingest))
 
-    return JobResponse(
-        job_id=job.job_id,
-        job_type=job.job_type.value,
-        status=job.status.value,
-        created_at=job.created_at,
-        started_at=job.started_at,
-        completed_at=job.completed_at,
-        error_message=job.error_message,
-        results_count=job.results_count,
-    )
+    return _job_response(job)
 
 
 @app.post("/crawl/all")
-def crawl_all(db: DBSession = Depends(get_session)):
+def crawl_all(
+    incremental: Optional[bool] = None,
+    ingest: Optional[IngestMode] = None,
+    db: DBSession = Depends(get_session),
+):
     """Agenda ambas as coletas (retorna job_ids)."""
     hockey_job_id = str(uuid.uuid4())
     oscar_job_id = str(uuid.uuid4())
@@ -177,8 +324,10 @@ def crawl_all(db: DBSession = Depends(get_session)):
 
     publish_jobs(
         [
-            {"job_id": hockey_job_id, "job_type": "hockey"},
-            {"job_id": oscar_job_id, "job_type": "oscar"},
+            _job_message(
+                hockey_job_id, "hockey", incremental=incremental, ingest=ingest
+            ),
+            _job_message(oscar_job_id, "oscar", incremental=incremental, ingest=ingest),
         ]
     )
 
@@ -192,51 +341,83 @@ def crawl_all(db: DBSession = Depends(get_session)):
 
 # Job management endpoints
 @app.get("/jobs", response_model=List[JobResponse])
-def list_jobs(db: DBSession = Depends(get_session)):
-    """Lista todos os jobs"""
-    jobs = db.query(Job).order_by(Job.created_at.desc()).all()
-    return [
-        JobResponse(
-            job_id=job.job_id,
-            job_type=job.job_type.value,
-            status=job.status.value,
-            created_at=job.created_at,
-            started_at=job.started_at,
-            completed_at=job.completed_at,
-            error_message=job.error_message,
-            results_count=job.results_count,
-        )
-        for job in jobs
-    ]
+async def list_jobs(
+    status: Optional[JobStatus] = None,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_session),
+):
+    """
+    Lista os jobs, mais recentes primeiro (opcionalmente filtrados por status).
+    Paginado por cursor: o próximo cursor vem no header X-Next-Cursor.
+    """
+    limit = page_size(limit)
+    stmt = select(Job)
+    if status is not None:
+        stmt = stmt.where(Job.status == status)
+    if cursor:
+        created_at, id_ = decode_cursor(cursor, (datetime, int))
+        stmt = stmt.where(tuple_(Job.created_at, Job.id) < (created_at, id_))
+    stmt = stmt.order_by(Job.created_at.desc(), Job.id.desc()).limit(limit + 1)
+    jobs, has_more = split_page((await db.scalars(stmt)).all(), limit)
+    next_page = next_cursor(jobs, has_more, "created_at", "id")
+    return json_response(
+        List[JobResponse],
+        [_job_response(job) for job in jobs],
+        headers={"X-Next-Cursor": next_page} if next_page is not None else None,
+    )
 
 
 @app.get("/jobs/{job_id}", response_model=JobResponse)
-def get_job(job_id: str, db: DBSession = Depends(get_session)):
-    """Status e detalhes de um job"""
-    job = db.query(Job).filter(Job.job_id == job_id).first()
+async def get_job(
+    job_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_session),
+):
+    """Status e detalhes de um job (ETag: 304 se o job não mudou)"""
+    job = await db.scalar(select(Job).where(Job.job_id == job_id))
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    return JobResponse(
-        job_id=job.job_id,
-        job_type=job.job_type.value,
-        status=job.status.value,
-        created_at=job.created_at,
-        started_at=job.started_at,
-        completed_at=job.completed_at,
-        error_message=job.error_message,
-        results_count=job.results_count,
-    )
+    not_modified = _not_modified(_job_etag(job), if_none_match, response, "no-cache")
+    if not_modified is not None:
+        return not_modified
+    return json_response(JobResponse, _job_response(job), dict(response.headers))
 
 
 @app.get("/jobs/{job_id}/results")
-def get_job_results(job_id: str, db: DBSession = Depends(get_session)):
-    """Resultados de um job específico"""
-    job = db.query(Job).filter(Job.job_id == job_id).first()
-    if not job:
+async def get_job_results(
+    job_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_session),
+):
+    """
+    Resultados de um job específico: snapshot gravado pelo worker na conclusão
+    do job (gzip), ou calculados e cacheados se o job não tiver snapshot.
+    ETag do corpo enviado: 304 se não mudou (snapshot: sem consultar os
+    resultados).
+    """
+    row = (
+        await db.execute(
+            select(Job, JobSnapshot.payload, *_generation_columns())
+            .outerjoin(JobSnapshot, JobSnapshot.job_id == Job.job_id)
+            .where(Job.job_id == job_id)
+        )
+    ).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Job not found")
+    job, payload, generation = row[0], row[1], tuple(row[2:])
 
     if job.status != JobStatus.COMPLETED:
+        # Body only depends on the status → job ETag
+        not_modified = _not_modified(
+            _job_etag(job), if_none_match, response, "no-cache"
+        )
+        if not_modified is not None:
+            return not_modified
         return {
             "job_id": job_id,
             "status": job.status.value,
@@ -244,107 +425,157 @@ def get_job_results(job_id: str, db: DBSession = Depends(get_session)):
             "results": [],
         }
 
-    # Get results based on job type
-    if job.job_type == JobType.HOCKEY:
-        results = (
-            db.query(HockeyTeamHistoric)
-            .filter(HockeyTeamHistoric.job_id == job_id)
-            .all()
-        )
-        return {
-            "job_id": job_id,
-            "status": job.status.value,
-            "job_type": job.job_type.value,
-            "results_count": len(results),
-            "results": [
-                HockeyTeamResponse(
-                    id=r.id,
-                    name=r.team.name,
-                    year=r.year,
-                    wins=r.wins,
-                    losses=r.losses,
-                    losses_ot=r.losses_ot,
-                    wins_percentage=r.wins_percentage,
-                    goals_for=r.goals_for,
-                    goals_against=r.goals_against,
-                    goal_difference=r.goal_difference,
-                )
-                for r in results
-            ],
-        }
-    else:  # OSCAR
-        results = (
-            db.query(OscarWinnerFilm)
-            .options(joinedload(OscarWinnerFilm.film))
-            .filter(OscarWinnerFilm.job_id == job_id)
-            .all()
+    if payload is not None:
+        # Snapshots never change once written: cacheable for RESULTS_MAX_AGE.
+        # Sent gzip'd as stored or decompressed, each with its own ETag (the
+        # decompressed body is determined by the gzip bytes, so no need to
+        # decompress for the tag)
+        gzipped = "gzip" in (accept_encoding or "")
+        not_modified = _not_modified(
+            _body_etag(payload, "-gzip" if gzipped else ""),
+            if_none_match,
+            response,
+            f"public, max-age={RESULTS_MAX_AGE}",
+            vary="Accept-Encoding",
         )
-        return {
-            "job_id": job_id,
-            "status": job.status.value,
-            "job_type": job.job_type.value,
-            "results_count": len(results),
-            "results": [
-                FilmResponse(
-                    id=r.id,
-                    title=r.film.title,
-                    year=r.year,
-                    nominations=r.nominations,
-                    awards=r.awards,
-                    best_picture=r.best_picture,
-                )
-                for r in results
-            ],
-        }
+        if not_modified is not None:
+            return not_modified
+        headers = dict(response.headers)
+        if gzipped:
+            headers["Content-Encoding"] = "gzip"
+        else:
+            payload = gzip.decompress(payload)
+        return encoded_response(payload, headers)
+
+    # No snapshot (job completed before snapshots existed, or it is still being
+    # written): build the payload. While a job runs the rows may still move to
+    # it, so don't cache then.
+    cacheable = generation[1] == 0
+    body = _job_results_cache.get(job_id, version=generation) if cacheable else None
+    if body is None:
+        rows = (await db.execute(job_results_select(job.job_type, job_id))).all()
+        body = dumps(job_results_payload(job, _results(job.job_type, rows)))
+        if cacheable:
+            _job_results_cache.put(job_id, body, version=generation)
+    # Later jobs may upsert rows away from this one: the body can change while
+    # the job doesn't, so clients must revalidate (ETag of this body)
+    not_modified = _not_modified(_body_etag(body), if_none_match, response, "no-cache")
+    if not_modified is not None:
+        return not_modified
+    return encoded_response(body, dict(response.headers))
 
 
 # Results endpoints
+async def _results_page(
+    db: AsyncSession,
+    job_type: JobType,
+    stmt: Select,
+    id_column,
+    limit: int,
+    cursor: Optional[str],
+) -> Response:
+    """One keyset page of ``stmt`` (ordered by ``id_column``), cached encoded."""
+    limit = page_size(limit)
+    stmt = stmt.order_by(id_column)
+    if cursor:
+        (after_id,) = decode_cursor(cursor, (int,))
+        stmt = stmt.where(id_column > after_id)
+
+    generation = await _results_generation(db)
+    key = (job_type.value, limit, cursor or None)
+    body = _listing_cache.get(key, version=generation)
+    if body is None:
+        rows, has_more = split_page(
+            (await db.execute(stmt.limit(limit + 1))).all(), limit
+        )
+        body = dumps(
+            {
+                "total": len(rows),
+                "limit": limit,
+                "next_cursor": next_cursor(rows, has_more, "id"),
+                "results": _results(job_type, rows),
+            }
+        )
+        _listing_cache.put(key, body, version=generation)
+    return encoded_response(body)
+
+
 @app.get("/results/hockey")
-def get_all_hockey_results(limit: int = 100, db: DBSession = Depends(get_session)):
-    """Todos os dados coletados de Hockey"""
-    results = db.query(HockeyTeamHistoric).limit(limit).all()
-    return {
-        "total": len(results),
-        "limit": limit,
-        "results": [
-            HockeyTeamResponse(
-                id=r.id,
-                name=r.team.name,
-                year=r.year,
-                wins=r.wins,
-                losses=r.losses,
-                losses_ot=r.losses_ot,
-                wins_percentage=r.wins_percentage,
-                goals_for=r.goals_for,
-                goals_against=r.goals_against,
-                goal_difference=r.goal_difference,
-            )
-            for r in results
-        ],
-    }
+async def get_all_hockey_results(
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_session),
+):
+    """Todos os dados coletados de Hockey (paginado por cursor)"""
+    return await _results_page(
+        db, JobType.HOCKEY, hockey_select(), HockeyTeamHistoric.id, limit, cursor
+    )
 
 
 @app.get("/results/oscar")
-def get_all_oscar_results(limit: int = 100, db: DBSession = Depends(get_session)):
-    """Todos os dados coletados de Oscar"""
-    results = (
-        db.query(OscarWinnerFilm)
-        .options(joinedload(OscarWinnerFilm.film))
-        .limit(limit)
-        .all()
+async def get_all_oscar_results(
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_session),
+):
+    """Todos os dados coletados de Oscar (paginado por cursor)"""
+    return await _results_page(
+        db, JobType.OSCAR, film_select(), OscarWinnerFilm.id, limit, cursor
+    )
+
+
+# Export endpoints (streamed, constant memory). Sync on purpose: rows come
+# from psycopg2 server-side cursors, iterated in the threadpool.
+def _export_response(
+    db: DBSession, stmt: Select, fmt: ExportFormat, name: str
+) -> StreamingResponse:
+    return StreamingResponse(
+        stream_rows(db.get_bind(), stmt, fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{fmt}"'},
+    )
+
+
+@app.get("/export/hockey")
+def export_hockey(
+    format: ExportFormat = "ndjson", db: DBSession = Depends(get_session)
+):
+    """Exporta todos os dados de Hockey (NDJSON ou CSV, em streaming)"""
+    return _export_response(
+        db,
+        hockey_select().order_by(HockeyTeamHistoric.id),
+        format,
+        "hockey",
+    )
+
+
+@app.get("/export/oscar")
+def export_oscar(format: ExportFormat = "ndjson", db: DBSession = Depends(get_session)):
+    """Exporta todos os dados de Oscar (NDJSON ou CSV, em streaming)"""
+    return _export_response(
+        db,
+        film_select().order_by(OscarWinnerFilm.id),
+        format,
+        "oscar",
+    )
+
+
+@app.get("/jobs/{job_id}/export")
+def export_job_results(
+    job_id: str,
+    format: ExportFormat = "ndjson",
+    db: DBSession = Depends(get_session),
+):
+    """Exporta os resultados de um job (NDJSON ou CSV, em streaming)"""
+    job = db.query(Job).filter(Job.job_id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status != JobStatus.COMPLETED:
+        raise HTTPException(status_code=409, detail="Job not completed yet")
+
+    return _export_response(
+        db,
+        job_results_select(job.job_type, job_id),
+        format,
+        f"{job.job_type.value}-{job_id}",
     )
-    return {
-        "total": len(results),
-        "limit": limit,
-        "results": [
-            FilmResponse(
-                id=r.id,
-                title=r.film.title,
-                year=r.year,
-                nominations=r.nominations,
-                awards=r.awards,
-                best_picture=r.best_picture,
-            )
-            for r in results
-        ],
-    }
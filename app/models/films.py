@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from app.database import Base
 from pydantic import BaseModel, Field
-from sqlalchemy import Boolean, ForeignKey, Integer, String
+from sqlalchemy import Boolean, ForeignKey, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
@@ -24,7 +24,11 @@ class Film(Base):
 # Table: oscar_winner_films (Oscar data, linked to films via film_id)
 class OscarWinnerFilm(Base):
     __tablename__ = "oscar_winner_films"
-    __table_args__ = {"extend_existing": True}
+    # Natural key: one row per film and ceremony year (upserted by each job)
+    __table_args__ = (
+        UniqueConstraint("film_id", "year", name="uq_oscar_winner_films_film_year"),
+        {"extend_existing": True},
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     film_id: Mapped[int] = mapped_column(
@@ -37,7 +41,8 @@ class OscarWinnerFilm(Base):
     nominations: Mapped[int] = mapped_column(Integer, nullable=False)
     awards: Mapped[int] = mapped_column(Integer, nullable=False)
     best_picture: Mapped[bool] = mapped_column(Boolean, default=False)
-    job_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # Last job that wrote this row (indexed for /jobs/{job_id}/results)
+    job_id: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
 
     film: Mapped[Film] = relationship("Film", back_populates="oscar_records")
 
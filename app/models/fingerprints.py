@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Dict
+
+from app.crawlers.storage import upsert_rows
+from app.database import Base
+from sqlalchemy import DateTime, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+# Payload fingerprint of each crawl unit (hockey page / Oscar year) as seen by
+# the last successful job of its source; used by incremental crawls.
+class CrawlFingerprint(Base):
+    __tablename__ = "crawl_fingerprints"
+    __table_args__ = (
+        UniqueConstraint("source", "unit", name="uq_crawl_fingerprints_source_unit"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    source: Mapped[str] = mapped_column(String(50), nullable=False)
+    unit: Mapped[str] = mapped_column(String(512), nullable=False)
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    job_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utc_now, onupdate=_utc_now
+    )
+
+    @classmethod
+    def load(cls, session: Session, source: str) -> Dict[str, str]:
+        """unit → fingerprint for ``source``."""
+        rows = session.query(cls.unit, cls.fingerprint).filter(cls.source == source)
+        return {unit: fingerprint for unit, fingerprint in rows}
+
+    @classmethod
+    def store(
+        cls,
+        session: Session,
+        source: str,
+        fingerprints: Dict[str, str],
+        job_id: str | None = None,
+    ) -> None:
+        """
+        Upsert fingerprints on (source, unit) (caller commits with the job
+        status): jobs of one source completing concurrently don't collide.
+        """
+        now = _utc_now()
+        upsert_rows(
+            session,
+            cls,
+            [
+                {
+                    "source": source,
+                    "unit": unit,
+                    "fingerprint": fingerprint,
+                    "job_id": job_id,
+                    "updated_at": now,
+                }
+                for unit, fingerprint in fingerprints.items()
+            ],
+            keys=("source", "unit"),
+        )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from app.database import Base
-from sqlalchemy import Float, ForeignKey, Integer, String
+from sqlalchemy import Float, ForeignKey, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
@@ -9,7 +9,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 class HockeyTeam(Base):
     __tablename__ = "hockey_team"
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    name: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
     historic: Mapped[list[HockeyTeamHistoric]] = relationship(
         "HockeyTeamHistoric", back_populates="team", lazy="joined"
     )
@@ -18,6 +18,11 @@ class HockeyTeam(Base):
 # Hockey Team Historic
 class HockeyTeamHistoric(Base):
     __tablename__ = "hockey_team_historic"
+    # Natural key: one row per team and season (upserted by each job). Its
+    # unique index also serves lookups by team_id.
+    __table_args__ = (
+        UniqueConstraint("team_id", "year", name="uq_hockey_team_historic_team_year"),
+    )
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     team_id: Mapped[int] = mapped_column(Integer, ForeignKey("hockey_team.id"))
     year: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -28,6 +33,7 @@ class HockeyTeamHistoric(Base):
     goals_for: Mapped[float] = mapped_column(Float, nullable=False)
     goals_against: Mapped[float] = mapped_column(Float, nullable=False)
     goal_difference: Mapped[float] = mapped_column(Float, nullable=False)
-    job_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # Last job that wrote this row (indexed for /jobs/{job_id}/results)
+    job_id: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
 
     team: Mapped[HockeyTeam] = relationship("HockeyTeam", back_populates="historic")
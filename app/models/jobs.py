@@ -2,7 +2,7 @@ from datetime import datetime, timezone
 from enum import Enum as PyEnum
 
 from app.database import Base
-from sqlalchemy import DateTime, Enum, Integer, String, Text
+from sqlalchemy import DateTime, Enum, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 
@@ -24,6 +24,13 @@ def _utc_now() -> datetime:
 
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        # GET /jobs: newest first, optionally filtered by status
+        Index("ix_jobs_created_at_id", "created_at", "id"),
+        Index("ix_jobs_status_created_at", "status", "created_at"),
+        # Result cache generation: latest completion
+        Index("ix_jobs_completed_at", "completed_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     job_id: Mapped[str] = mapped_column(
@@ -44,3 +51,12 @@ class Job(Base):
     )
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     results_count: Mapped[int] = mapped_column(Integer, default=0)
+    # Incremental crawls: units (pages/years) skipped as unchanged vs refreshed
+    # (server default: backfills rows of databases upgraded by ensure_columns)
+    units_skipped: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    units_refreshed: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    # Scraper HTTP requests revalidated by the cache (304) vs downloaded in full
+    http_cache_hits: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    http_cache_misses: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0"
+    )
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from app.database import Base
+from sqlalchemy import DateTime, LargeBinary, String
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+# Final /jobs/{job_id}/results payload of a completed job, gzip'd JSON written
+# once by the worker (see app.results.build_snapshot) and served as-is.
+class JobSnapshot(Base):
+    __tablename__ = "job_snapshots"
+
+    job_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utc_now
+    )
+
+    @classmethod
+    def store(cls, session: Session, job_id: str, payload: bytes) -> None:
+        """Insert/replace the snapshot of ``job_id`` (caller commits)."""
+        session.merge(cls(job_id=job_id, payload=payload, created_at=_utc_now()))
@@ -0,0 +1,57 @@
+"""
+Opaque keyset (cursor) pagination helpers for the API.
+
+A cursor encodes the sort key of the last row of a page (e.g. ``(created_at,
+id)`` or ``(id,)``); the next page is fetched with ``WHERE key > cursor``
+(``<`` for descending order) on an indexed key, so page N costs the same as
+page 1. Cursors are URL-safe base64 JSON and must be treated as opaque.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+
+from app.config import MAX_PAGE_SIZE
+
+
+def page_size(limit: int) -> int:
+    """Clamp a requested page size to ``1..MAX_PAGE_SIZE``."""
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def encode_cursor(*key: Any) -> str:
+    values = [v.isoformat() if isinstance(v, datetime) else v for v in key]
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> Tuple[Any, ...]:
+    """Decode a cursor into values of ``types`` (400 if it is malformed)."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("wrong cursor length")
+        return tuple(
+            datetime.fromisoformat(v) if t is datetime else t(v)
+            for t, v in zip(types, values)
+        )
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def split_page(rows: List[Any], limit: int) -> Tuple[List[Any], bool]:
+    """Rows were fetched with ``limit + 1``: return the page and has-more flag."""
+    return rows[:limit], len(rows) > limit
+
+
+def next_cursor(rows: List[Any], has_more: bool, *attrs: str) -> Optional[str]:
+    """Cursor after the last row of the page (None on the last page)."""
+    if not has_more or not rows:
+        return None
+    last = rows[-1]
+    return encode_cursor(*(getattr(last, attr) for attr in attrs))
@@ -0,0 +1,73 @@
+"""
+Fast JSON path for the read endpoints.
+
+Rows are projected straight to mappings, validated once per response with a
+cached pydantic ``TypeAdapter`` of the list type (``TypedDict`` rows, so
+validation yields plain dicts, no model instances) and encoded with orjson,
+or the stdlib encoder when orjson isn't installed. Endpoints return the
+response themselves, so FastAPI skips its own ``response_model`` validation
+and serialization (``response_model`` still documents the schema).
+"""
+
+import json
+from datetime import date, datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Mapping, Optional
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json fallback
+    orjson = None
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+@lru_cache(maxsize=None)
+def type_adapter(tp: Any) -> TypeAdapter:
+    """One ``TypeAdapter`` per type: building one compiles its validator."""
+    return TypeAdapter(tp)
+
+
+def validate(tp: Any, data: Any) -> Any:
+    return type_adapter(tp).validate_python(data)
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, default=_default)
+    return json.dumps(
+        content, ensure_ascii=False, separators=(",", ":"), default=_default
+    ).encode()
+
+
+class FastJSONResponse(JSONResponse):
+    """``JSONResponse`` rendered with ``dumps`` (orjson when available)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def json_response(
+    tp: Any, data: Any, headers: Optional[Mapping[str, str]] = None
+) -> FastJSONResponse:
+    """``data`` validated as ``tp`` and rendered in one pass."""
+    return FastJSONResponse(validate(tp, data), headers=headers)
+
+
+def encoded_response(
+    body: bytes, headers: Optional[Mapping[str, str]] = None
+) -> Response:
+    """Response for a body already encoded with ``dumps`` (e.g. cached)."""
+    return Response(body, media_type=JSON_MEDIA_TYPE, headers=headers)
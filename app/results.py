@@ -0,0 +1,85 @@
+"""
+Result queries and payloads shared by the API and the worker.
+
+The ``/jobs/{job_id}/results`` payload of a job is fixed once the job
+completes, so the worker materializes it then (``build_snapshot``) as gzip'd
+JSON in ``job_snapshots``; the API sends those bytes back without touching the
+results tables or building models.
+"""
+
+import gzip
+import json
+from typing import Any, Dict, List
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session as DBSession
+
+from app.models.films import Film, OscarWinnerFilm
+from app.models.hockey_teams import HockeyTeam, HockeyTeamHistoric
+from app.models.jobs import Job, JobType
+
+
+def hockey_select() -> Select:
+    """
+    Hockey results as one explicit join, projecting only the response columns
+    (no ORM entities → no lazy team loads dragging in each team's history).
+    Plain ``Select``: runs on sync and async sessions alike.
+    """
+    return select(
+        HockeyTeamHistoric.id,
+        HockeyTeam.name,
+        HockeyTeamHistoric.year,
+        HockeyTeamHistoric.wins,
+        HockeyTeamHistoric.losses,
+        HockeyTeamHistoric.losses_ot,
+        HockeyTeamHistoric.wins_percentage,
+        HockeyTeamHistoric.goals_for,
+        HockeyTeamHistoric.goals_against,
+        HockeyTeamHistoric.goal_difference,
+    ).join(HockeyTeam, HockeyTeam.id == HockeyTeamHistoric.team_id)
+
+
+def film_select() -> Select:
+    """Oscar results as one projected join (see ``hockey_select``)."""
+    return select(
+        OscarWinnerFilm.id,
+        Film.title,
+        OscarWinnerFilm.year,
+        OscarWinnerFilm.nominations,
+        OscarWinnerFilm.awards,
+        OscarWinnerFilm.best_picture,
+    ).join(Film, Film.id == OscarWinnerFilm.film_id)
+
+
+def job_results_select(job_type: JobType, job_id: str) -> Select:
+    """Rows written by ``job_id``, in insertion (id) order."""
+    if job_type == JobType.HOCKEY:
+        return (
+            hockey_select()
+            .where(HockeyTeamHistoric.job_id == job_id)
+            .order_by(HockeyTeamHistoric.id)
+        )
+    return (
+        film_select()
+        .where(OscarWinnerFilm.job_id == job_id)
+        .order_by(OscarWinnerFilm.id)
+    )
+
+
+def job_results_payload(job: Job, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """``/jobs/{job_id}/results`` body of a completed job (JSON-ready)."""
+    return {
+        "job_id": job.job_id,
+        "status": job.status.value,
+        "job_type": job.job_type.value,
+        "results_count": len(results),
+        "results": results,
+    }
+
+
+def build_snapshot(db: DBSession, job: Job) -> bytes:
+    """``job_results_payload`` encoded as gzip'd JSON, as stored in snapshots."""
+    rows = db.execute(job_results_select(job.job_type, job.job_id))
+    results = [row._asdict() for row in rows]
+    raw = json.dumps(job_results_payload(job, results), separators=(",", ":"))
+    return gzip.compress(raw.encode(), mtime=0)
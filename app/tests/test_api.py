@@ -0,0 +1,503 @@
+import asyncio
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.database import Base, async_database_url, get_async_session, get_session
+from app.export import stream_rows
+from app.main import _job_results_cache, _listing_cache, app
+from app.models.films import Film, OscarWinnerFilm
+from app.models.hockey_teams import HockeyTeam, HockeyTeamHistoric
+from app.models.jobs import Job, JobStatus, JobType
+from app.models.snapshots import JobSnapshot
+from app.results import build_snapshot, hockey_select
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    # File database: shared by the sync engine and the API's async one
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'api.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def async_engine(session_factory):
+    # NullPool: TestClient may run each request on a new event loop
+    engine = create_async_engine(
+        async_database_url(str(session_factory.kw["bind"].url)), poolclass=NullPool
+    )
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def client(session_factory, async_engine):
+    def override_get_session():
+        with session_factory() as session:
+            yield session
+
+    async def override_get_async_session():
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_async_session] = override_get_async_session
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_session, None)
+    app.dependency_overrides.pop(get_async_session, None)
+
+
+@pytest.fixture(autouse=True)
+def clear_result_caches():
+    _job_results_cache.clear()
+    _listing_cache.clear()
+    yield
+    _job_results_cache.clear()
+    _listing_cache.clear()
+
+
+@pytest.fixture
+def statements(session_factory, async_engine):
+    captured = []
+    for engine in (session_factory.kw["bind"], async_engine.sync_engine):
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: captured.append(statement),
+        )
+    return captured
+
+
+def _seed(session_factory, teams: int, years: int, films: int = 0) -> None:
+    with session_factory() as session:
+        session.add_all(
+            [
+                Job(job_id="hockey-job", job_type=JobType.HOCKEY),
+                Job(job_id="oscar-job", job_type=JobType.OSCAR),
+            ]
+        )
+        for i in range(teams):
+            team = HockeyTeam(name=f"Team {i}")
+            session.add(team)
+            session.flush()
+            session.add_all(
+                HockeyTeamHistoric(
+                    team_id=team.id,
+                    year=1990 + y,
+                    wins=40,
+                    losses=30,
+                    losses_ot=10,
+                    wins_percentage=0.5,
+                    goals_for=250,
+                    goals_against=240,
+                    goal_difference=10,
+                    job_id="hockey-job",
+                )
+                for y in range(years)
+            )
+        for i in range(films):
+            film = Film(title=f"Film {i}")
+            session.add(film)
+            session.flush()
+            session.add(
+                OscarWinnerFilm(
+                    film_id=film.id,
+                    year=2010,
+                    nominations=4,
+                    awards=1,
+                    best_picture=i == 0,
+                    job_id="oscar-job",
+                )
+            )
+        session.query(Job).update({Job.status: JobStatus.COMPLETED})
+        session.commit()
+
+
+@pytest.mark.parametrize("path", ["/results/hockey", "/jobs/hockey-job/results"])
+@pytest.mark.parametrize("teams,years", [(2, 2), (20, 4)])
+def test_hockey_results_use_constant_number_of_statements(
+    client, session_factory, statements, path, teams, years
+):
+    _seed(session_factory, teams=teams, years=years)
+    statements.clear()
+
+    response = client.get(path)
+
+    assert response.status_code == 200
+    assert len(response.json()["results"]) == teams * years
+    # job (+ snapshot) lookup / cache generation + one join query, whatever
+    # the row count
+    assert len(statements) == 2
+
+
+def test_hockey_results_project_team_name(client, session_factory, statements):
+    _seed(session_factory, teams=3, years=1)
+    statements.clear()
+
+    response = client.get("/jobs/hockey-job/results")
+
+    body = response.json()
+    assert body["results_count"] == 3
+    assert {r["name"] for r in body["results"]} == {"Team 0", "Team 1", "Team 2"}
+    assert set(body["results"][0]) == {
+        "id",
+        "name",
+        "year",
+        "wins",
+        "losses",
+        "losses_ot",
+        "wins_percentage",
+        "goals_for",
+        "goals_against",
+        "goal_difference",
+    }
+    # job + snapshot lookup and one join query; no per-row team/history loads
+    assert len(statements) == 2
+    assert "JOIN hockey_team" in statements[1]
+
+
+def test_oscar_results_single_join_query(client, session_factory, statements):
+    _seed(session_factory, teams=0, years=0, films=5)
+    statements.clear()
+
+    response = client.get("/results/oscar")
+
+    assert [r["title"] for r in response.json()["results"]][:1] == ["Film 0"]
+    assert len(response.json()["results"]) == 5
+    assert len(statements) == 2  # cache generation + join
+
+
+def _walk(client, path: str, limit: int) -> list:
+    pages, cursor = [], None
+    while True:
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        body = client.get(path, params=params).json()
+        pages.append(body["results"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_results_keyset_pagination_walks_every_row_once(client, session_factory):
+    _seed(session_factory, teams=5, years=2, films=7)
+
+    hockey = _walk(client, "/results/hockey", limit=3)
+    assert [len(p) for p in hockey] == [3, 3, 3, 1]
+    ids = [r["id"] for page in hockey for r in page]
+    assert ids == sorted(ids) and len(set(ids)) == 10
+
+    oscar = _walk(client, "/results/oscar", limit=7)
+    assert [len(p) for p in oscar] == [7]
+
+
+def test_jobs_keyset_pagination_with_equal_timestamps(client, session_factory):
+    same_time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    with session_factory() as session:
+        session.add_all(
+            Job(
+                job_id=f"job-{i}",
+                job_type=JobType.HOCKEY,
+                created_at=same_time - timedelta(hours=i // 2),
+            )
+            for i in range(7)
+        )
+        session.commit()
+
+    seen, cursor = [], None
+    while True:
+        response = client.get("/jobs", params={"limit": 2, "cursor": cursor})
+        seen += [job["job_id"] for job in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert sorted(seen) == [f"job-{i}" for i in range(7)]
+    assert len(seen) == 7
+    assert seen[-1] == "job-6"  # oldest last
+
+
+def test_page_size_is_capped(client, session_factory):
+    _seed(session_factory, teams=1, years=1)
+    with patch("app.pagination.MAX_PAGE_SIZE", 5):
+        body = client.get("/results/hockey", params={"limit": 10_000}).json()
+    assert body["limit"] == 5
+
+
+def test_invalid_cursor_rejected(client):
+    assert client.get("/results/oscar", params={"cursor": "%%%"}).status_code == 400
+    assert client.get("/jobs", params={"cursor": "WzFd"}).status_code == 400
+
+
+def test_export_hockey_ndjson(client, session_factory):
+    _seed(session_factory, teams=3, years=3)
+
+    response = client.get("/export/hockey")
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == 9
+    assert [r["id"] for r in rows] == sorted(r["id"] for r in rows)
+    assert rows[0]["name"] == "Team 0" and rows[0]["goal_difference"] == 10
+
+
+def test_stream_rows_yields_one_chunk_per_batch(session_factory):
+    _seed(session_factory, teams=3, years=3)
+
+    chunks = list(
+        stream_rows(
+            session_factory.kw["bind"],
+            hockey_select().order_by(HockeyTeamHistoric.id),
+            "csv",
+            batch_size=4,
+        )
+    )
+
+    assert [c.count("\n") for c in chunks] == [1 + 4, 4, 1]  # header + 9 rows
+    assert chunks[0].startswith("id,name,year,")
+
+
+def test_export_oscar_csv(client, session_factory):
+    _seed(session_factory, teams=0, years=0, films=2)
+
+    response = client.get("/export/oscar", params={"format": "csv"})
+
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="oscar.csv"' in response.headers["content-disposition"]
+    lines = response.text.splitlines()
+    assert lines[0] == "id,title,year,nominations,awards,best_picture"
+    assert len(lines) == 3 and lines[1].split(",")[1] == "Film 0"
+
+
+def test_export_job_results(client, session_factory):
+    _seed(session_factory, teams=2, years=1, films=1)
+
+    hockey = client.get("/jobs/hockey-job/export").text.splitlines()
+    oscar = client.get("/jobs/oscar-job/export").text.splitlines()
+
+    assert len(hockey) == 2 and "name" in json.loads(hockey[0])
+    assert len(oscar) == 1 and json.loads(oscar[0])["title"] == "Film 0"
+    assert client.get("/jobs/missing/export").status_code == 404
+
+
+@pytest.mark.parametrize("path", ["/results/hockey", "/jobs/hockey-job/results"])
+def test_results_served_from_cache(client, session_factory, statements, path):
+    _seed(session_factory, teams=3, years=2)
+    cache = "job_results" if path.startswith("/jobs") else "results"
+    before = client.get("/metrics/cache").json()[cache]
+    first = client.get(path).json()
+    statements.clear()
+
+    second = client.get(path).json()
+
+    assert second == first
+    # Only the job (+ snapshot) lookup / generation check, no results query
+    assert len(statements) == 1
+    after = client.get("/metrics/cache").json()[cache]
+    assert after["hits"] - before["hits"] == 1
+    assert after["misses"] - before["misses"] == 1
+
+
+@pytest.mark.parametrize("path", ["/results/hockey", "/jobs/hockey-job/results"])
+def test_job_completion_invalidates_cached_results(
+    client, session_factory, statements, path
+):
+    _seed(session_factory, teams=2, years=1)
+    assert len(client.get(path).json()["results"]) == 2
+    cache = "job_results" if path.startswith("/jobs") else "results"
+    expirations = client.get("/metrics/cache").json()[cache]["expirations"]
+
+    # Another job takes over a row and completes
+    with session_factory() as session:
+        session.add(
+            Job(
+                job_id="later-job",
+                job_type=JobType.HOCKEY,
+                status=JobStatus.COMPLETED,
+                completed_at=datetime.now(timezone.utc),
+            )
+        )
+        session.query(HockeyTeamHistoric).filter(HockeyTeamHistoric.id == 1).update(
+            {HockeyTeamHistoric.job_id: "later-job", HockeyTeamHistoric.wins: 99}
+        )
+        session.commit()
+    statements.clear()
+
+    results = client.get(path).json()["results"]
+
+    assert len(statements) == 2  # recomputed
+    if path.startswith("/jobs"):
+        assert [r["id"] for r in results] == [2]
+    else:
+        assert results[0]["wins"] == 99
+    metrics = client.get("/metrics/cache").json()
+    assert metrics[cache]["expirations"] == expirations + 1
+
+
+def test_job_results_not_cached_while_a_job_runs(client, session_factory):
+    _seed(session_factory, teams=1, years=1)
+    with session_factory() as session:
+        session.add(
+            Job(job_id="running", job_type=JobType.HOCKEY, status=JobStatus.RUNNING)
+        )
+        session.commit()
+
+    client.get("/jobs/hockey-job/results")
+    client.get("/jobs/hockey-job/results")
+
+    assert len(_job_results_cache) == 0
+
+
+@pytest.mark.parametrize("path", ["/jobs/hockey-job", "/jobs/hockey-job/results"])
+def test_matching_etag_returns_304_from_jobs_row(
+    client, session_factory, statements, path
+):
+    _seed(session_factory, teams=2, years=2)
+    _store_snapshot(session_factory, "hockey-job")
+    etag = client.get(path).headers["ETag"]
+    statements.clear()
+
+    response = client.get(path, headers={"If-None-Match": f'"other", W/{etag}'})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    assert len(statements) == 1
+    assert "hockey_team" not in statements[0]
+
+
+def test_job_reports_http_cache_counters(client, session_factory):
+    _seed(session_factory, teams=1, years=1)
+    with session_factory() as session:
+        session.query(Job).filter(Job.job_id == "hockey-job").update(
+            {Job.http_cache_hits: 4, Job.http_cache_misses: 1}
+        )
+        session.commit()
+
+    body = client.get("/jobs/hockey-job").json()
+
+    assert (body["http_cache_hits"], body["http_cache_misses"]) == (4, 1)
+
+
+def test_etag_changes_with_job_state(client, session_factory):
+    _seed(session_factory, teams=1, years=1)
+    etag = client.get("/jobs/hockey-job").headers["ETag"]
+
+    with session_factory() as session:
+        session.query(Job).filter(Job.job_id == "hockey-job").update(
+            {Job.results_count: 1, Job.completed_at: datetime.now(timezone.utc)}
+        )
+        session.commit()
+    response = client.get("/jobs/hockey-job", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_live_results_etag_follows_rows_moved_to_a_later_job(client, session_factory):
+    _seed(session_factory, teams=2, years=1)
+    etag = client.get("/jobs/hockey-job/results").headers["ETag"]
+
+    # The job row is unchanged, but a later job upserts one of its rows
+    with session_factory() as session:
+        session.add(
+            Job(
+                job_id="later-job",
+                job_type=JobType.HOCKEY,
+                status=JobStatus.COMPLETED,
+                completed_at=datetime.now(timezone.utc),
+            )
+        )
+        session.query(HockeyTeamHistoric).filter(HockeyTeamHistoric.id == 1).update(
+            {HockeyTeamHistoric.job_id: "later-job"}
+        )
+        session.commit()
+    response = client.get("/jobs/hockey-job/results", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["results_count"] == 1
+
+
+def test_results_cache_control(client, session_factory):
+    _seed(session_factory, teams=1, years=1)
+    with session_factory() as session:
+        session.add(Job(job_id="pending", job_type=JobType.HOCKEY))
+        session.commit()
+
+    live = client.get("/jobs/hockey-job/results")
+    _store_snapshot(session_factory, "hockey-job")
+    snapshot = client.get("/jobs/hockey-job/results")
+    pending = client.get("/jobs/pending/results")
+
+    assert snapshot.headers["Cache-Control"].startswith("public, max-age=")
+    # Computed from the tables: may change while the job doesn't
+    assert live.headers["Cache-Control"] == "no-cache"
+    assert pending.headers["Cache-Control"] == "no-cache"
+    assert client.get("/jobs/pending").headers["Cache-Control"] == "no-cache"
+
+
+def _store_snapshot(session_factory, job_id: str) -> bytes:
+    with session_factory() as session:
+        job = session.query(Job).filter(Job.job_id == job_id).one()
+        payload = build_snapshot(session, job)
+        JobSnapshot.store(session, job_id, payload)
+        session.commit()
+    return payload
+
+
+def test_job_results_served_from_snapshot(client, session_factory, statements):
+    _seed(session_factory, teams=3, years=2)
+    live = client.get("/jobs/hockey-job/results").json()
+    payload = _store_snapshot(session_factory, "hockey-job")
+    statements.clear()
+
+    response = client.get("/jobs/hockey-job/results")
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.json() == live
+    # One job + snapshot lookup: the results tables are not queried
+    assert len(statements) == 1
+    assert "hockey_team" not in " ".join(statements)
+
+    raw = client.get(
+        "/jobs/hockey-job/results", headers={"Accept-Encoding": "identity"}
+    )
+    assert "Content-Encoding" not in raw.headers
+    assert raw.content == gzip.decompress(payload)
+    # One strong ETag per encoding
+    assert raw.headers["ETag"] != response.headers["ETag"]
+    assert raw.headers["Vary"] == response.headers["Vary"] == "Accept-Encoding"
+
+
+def test_snapshot_304_per_encoding(client, session_factory):
+    _seed(session_factory, teams=2, years=1)
+    _store_snapshot(session_factory, "hockey-job")
+    path = "/jobs/hockey-job/results"
+    gzip_etag = client.get(path, headers={"Accept-Encoding": "gzip"}).headers["ETag"]
+
+    not_modified = client.get(
+        path, headers={"Accept-Encoding": "gzip", "If-None-Match": gzip_etag}
+    )
+    identity = client.get(
+        path, headers={"Accept-Encoding": "identity", "If-None-Match": gzip_etag}
+    )
+
+    assert not_modified.status_code == 304
+    assert not_modified.headers["Vary"] == "Accept-Encoding"
+    # The gzip ETag doesn't validate the decompressed body
+    assert identity.status_code == 200
+    assert "Content-Encoding" not in identity.headers
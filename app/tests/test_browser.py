@@ -0,0 +1,280 @@
+import json
+import os
+import subprocess
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from app.crawlers import browser
+from app.crawlers.browser import DriverPool
+from app.crawlers.crawler import HockeyHistoricScraper, Scraper
+
+
+def _fake_driver() -> MagicMock:
+    driver = MagicMock()
+    driver.execute_script.return_value = "https://example.com"
+    driver.execute_cdp_cmd.return_value = {}
+    return driver
+
+
+def _pool(**kwargs) -> tuple[DriverPool, list[MagicMock]]:
+    created: list[MagicMock] = []
+
+    def factory():
+        created.append(_fake_driver())
+        return created[-1]
+
+    kwargs.setdefault("max_memory_mb", 0)
+    return DriverPool(factory=factory, **kwargs), created
+
+
+def test_driver_reused_and_reset_between_jobs():
+    pool, created = _pool(size=1)
+
+    with pool.acquire() as first:
+        pass
+    with pool.acquire() as second:
+        pass
+
+    assert first is second
+    assert len(created) == 1
+    driver = created[0]
+    driver.execute_cdp_cmd.assert_any_call(
+        "Storage.clearDataForOrigin",
+        {"origin": "https://example.com", "storageTypes": "all"},
+    )
+    driver.execute_cdp_cmd.assert_any_call("Network.clearBrowserCookies", {})
+    driver.get.assert_called_with("about:blank")
+    driver.quit.assert_not_called()
+
+
+def test_warm_starts_drivers_up_front():
+    pool, created = _pool(size=3)
+    pool.warm()
+    assert len(created) == 3
+
+
+def test_driver_recycled_after_max_jobs():
+    pool, created = _pool(size=1, max_jobs=2)
+
+    for _ in range(3):
+        with pool.acquire():
+            pass
+
+    assert len(created) == 2
+    created[0].quit.assert_called_once()
+
+
+def test_driver_recycled_after_max_pages():
+    pool, created = _pool(size=1, max_pages=10)
+
+    with pool.acquire() as pooled:
+        pooled.pages += 10
+    with pool.acquire():
+        pass
+
+    assert len(created) == 2
+    created[0].quit.assert_called_once()
+
+
+def test_driver_recycled_over_memory_threshold():
+    pool = DriverPool(size=1, max_memory_mb=256, factory=_fake_driver)
+    pooled = pool.checkout()
+    pooled.driver.service.process.pid = 4242
+
+    with patch.object(browser, "process_tree_rss_mb", return_value=300) as rss:
+        pool.checkin(pooled)
+
+    rss.assert_called_once_with(4242)
+    pooled.driver.quit.assert_called_once()
+
+
+def test_process_tree_rss_includes_children():
+    child = subprocess.Popen(
+        [sys.executable, "-c", "x = bytearray(64 * 1024 * 1024); input()"],
+        stdin=subprocess.PIPE,
+    )
+    try:
+        deadline = time.monotonic() + 10
+        while (browser.process_tree_rss_mb(child.pid) or 0) < 64:
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+        own = browser.process_tree_rss_mb(os.getpid())
+        assert own >= browser.process_tree_rss_mb(child.pid) + 1
+    finally:
+        child.kill()
+        child.wait()
+
+
+def test_driver_discarded_when_reset_fails():
+    pool, created = _pool(size=1)
+
+    with pool.acquire() as pooled:
+        pooled.driver.get.side_effect = WebDriverException("crashed")
+    with pool.acquire():
+        pass
+
+    assert len(created) == 2
+    created[0].quit.assert_called_once()
+
+
+def test_checkout_times_out_when_pool_exhausted():
+    pool, _ = _pool(size=1)
+    pool.checkout()
+    with pytest.raises(TimeoutError):
+        pool.checkout(timeout=0.01)
+
+
+def test_checkout_replaces_dead_idle_driver():
+    pool, created = _pool(size=1)
+    pool.warm()
+    created[0].execute_script.side_effect = WebDriverException("chrome not reachable")
+
+    pooled = pool.checkout(timeout=0.01)
+
+    assert pooled.driver is created[1]
+    created[0].quit.assert_called_once()
+
+
+def test_close_quits_drivers_checked_in_later_and_refuses_checkout():
+    pool, created = _pool(size=2)
+    pool.warm()
+    borrowed = pool.checkout()
+
+    pool.close()
+    pool.checkin(borrowed)
+
+    for driver in created:
+        driver.quit.assert_called_once()
+    with pytest.raises(RuntimeError):
+        pool.checkout(timeout=0.01)
+
+
+def test_scraper_borrows_and_returns_pooled_driver():
+    pool, created = _pool(size=1)
+
+    with Scraper(driver_pool=pool) as scraper:
+        scraper._navigate("https://example.com/a")
+        scraper._navigate("https://example.com/b")
+        assert scraper.driver is created[0]
+
+    assert scraper.driver is None
+    created[0].quit.assert_not_called()
+    with pool.acquire() as pooled:
+        assert pooled.pages == 2
+        assert pooled.jobs == 1
+
+
+def test_scraper_discards_pooled_driver_when_setup_fails():
+    pool, created = _pool(size=1)
+    pool.warm()
+    created[0].execute_cdp_cmd.side_effect = WebDriverException("dead")
+
+    with pytest.raises(WebDriverException):
+        with HockeyHistoricScraper(engine="selenium", driver_pool=pool):
+            pass
+
+    created[0].quit.assert_called_once()
+    # The slot was freed: no wait for a driver that is never returned
+    assert pool.checkout(timeout=0.01).driver is created[1]
+
+
+def test_scraper_quits_own_driver_when_setup_fails():
+    driver = _fake_driver()
+    driver.execute_cdp_cmd.side_effect = WebDriverException("dead")
+
+    with patch("app.crawlers.crawler.create_chrome_driver", return_value=driver):
+        with pytest.raises(WebDriverException):
+            with HockeyHistoricScraper(engine="selenium"):
+                pass
+
+    driver.quit.assert_called_once()
+
+
+@pytest.fixture
+def driver_cache(tmp_path, monkeypatch):
+    cache_file = tmp_path / "chromedriver.json"
+    monkeypatch.setattr(browser, "CHROMEDRIVER_CACHE_FILE", str(cache_file))
+    monkeypatch.setattr(browser, "CHROMEDRIVER_OFFLINE", False)
+    monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
+    monkeypatch.setattr(browser, "chrome_version", lambda _bin: "126.0.1")
+    browser.resolve_chromedriver.cache_clear()
+    yield cache_file
+    browser.resolve_chromedriver.cache_clear()
+
+
+def test_chromedriver_resolved_once_and_persisted(driver_cache, tmp_path):
+    binary = tmp_path / "chromedriver"
+    binary.write_text("")
+
+    with patch("webdriver_manager.chrome.ChromeDriverManager") as manager:
+        manager.return_value.install.return_value = str(binary)
+        assert browser.resolve_chromedriver() == str(binary)
+        assert browser.resolve_chromedriver() == str(binary)
+
+    manager.return_value.install.assert_called_once()
+    assert json.loads(driver_cache.read_text()) == {"126.0.1": str(binary)}
+
+    # New process: served from the on-disk cache, no webdriver-manager
+    browser.resolve_chromedriver.cache_clear()
+    with patch("webdriver_manager.chrome.ChromeDriverManager") as manager:
+        assert browser.resolve_chromedriver() == str(binary)
+    manager.assert_not_called()
+
+
+def test_chromedriver_offline_never_downloads(driver_cache, monkeypatch):
+    monkeypatch.setattr(browser, "CHROMEDRIVER_OFFLINE", True)
+
+    with (
+        patch.dict(os.environ),
+        patch("webdriver_manager.chrome.ChromeDriverManager") as manager,
+    ):
+        os.environ.pop("SE_OFFLINE", None)
+        assert browser.resolve_chromedriver() is None
+        assert os.environ["SE_OFFLINE"] == "true"
+
+    manager.assert_not_called()
+
+
+def test_scraper_blocks_heavy_resources_except_unblocked():
+    pool, created = _pool(size=1)
+
+    with Scraper(driver_pool=pool, unblocked_resources=["svg", "hotjar.com"]):
+        pass
+
+    driver = created[0]
+    driver.execute_cdp_cmd.assert_any_call("Network.enable", {})
+    blocked = next(
+        call.args[1]["urls"]
+        for call in driver.execute_cdp_cmd.call_args_list
+        if call.args[0] == "Network.setBlockedURLs"
+    )
+    assert "*.png" in blocked and "*.woff2?*" in blocked
+    assert "*google-analytics.com*" in blocked
+    assert not any("svg" in p or "hotjar" in p for p in blocked)
+
+
+def test_unblocked_resources_must_be_blocked_categories():
+    with pytest.raises(ValueError):
+        browser.blocked_url_patterns(["https://host/logo.png"])
+
+
+def test_scraper_without_blocking_clears_pooled_driver_blocklist():
+    pool, created = _pool(size=1)
+
+    with Scraper(driver_pool=pool, block_resources=False):
+        pass
+
+    created[0].execute_cdp_cmd.assert_any_call("Network.setBlockedURLs", {"urls": []})
+
+
+def test_driver_created_with_page_load_strategy(monkeypatch):
+    monkeypatch.setattr(browser, "resolve_chromedriver", lambda: None)
+
+    with patch.object(browser.webdriver, "Chrome") as chrome:
+        browser.create_chrome_driver(page_load_strategy="eager")
+
+    assert chrome.call_args.kwargs["options"].page_load_strategy == "eager"
@@ -0,0 +1,67 @@
+import threading
+from unittest.mock import patch
+
+from app.cache import LRUCache
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now the oldest
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get_many(["a", "c"]) == {"a": 1, "c": 3}
+    assert cache.stats() == {
+        "size": 2,
+        "maxsize": 2,
+        "hits": 3,
+        "misses": 1,
+        "evictions": 1,
+        "expirations": 0,
+    }
+
+
+def test_zero_maxsize_disables_cache():
+    cache = LRUCache(0)
+    cache.put("a", 1)
+    assert len(cache) == 0 and cache.get("a") is None
+
+
+def test_concurrent_updates_stay_bounded():
+    cache = LRUCache(50)
+
+    def writer(offset):
+        for i in range(500):
+            cache.put(offset + i, i)
+            cache.get(offset + i // 2)
+
+    threads = [threading.Thread(target=writer, args=(n * 1000,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(cache) == 50
+
+
+def test_entries_expire_after_ttl():
+    cache = LRUCache(10, ttl=5)
+    with patch("app.cache.time.monotonic", return_value=100.0):
+        cache.put("a", 1)
+    with patch("app.cache.time.monotonic", return_value=104.0):
+        assert cache.get("a") == 1
+    with patch("app.cache.time.monotonic", return_value=105.5):
+        assert cache.get("a") is None
+    assert len(cache) == 0 and cache.expirations == 1
+
+
+def test_stale_version_is_a_miss():
+    cache = LRUCache(10)
+    cache.put("job", "payload", version=1)
+
+    assert cache.get("job", version=1) == "payload"
+    assert cache.get("job", version=2) is None
+    assert cache.get("job", version=1) is None  # dropped
+    assert (cache.hits, cache.misses, cache.expirations) == (1, 2, 1)
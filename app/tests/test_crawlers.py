@@ -1,11 +1,15 @@
+import hashlib
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 from selenium.common.exceptions import StaleElementReferenceException
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from app.crawlers.crawler import HockeyHistoricScraper
+from app.crawlers.crawler import HockeyHistoricScraper, OscarScraper
 from app.database import Base
 from app.models.hockey_teams import HockeyTeam, HockeyTeamHistoric
 
@@ -23,6 +27,29 @@ HOCKEY_HEADER = [
 ]
 
 
+def _make_html(rows: list[list[str]], pages: int = 1) -> str:
+    """Build a server-rendered forms page (header row + data rows + pagination)."""
+    header = "".join(f"<th>{h}</th>" for h in HOCKEY_HEADER)
+    body = "".join(
+        "<tr class='team'>" + "".join(f"<td>\n  {c}\n</td>" for c in row) + "</tr>"
+        for row in rows
+    )
+    links = "".join(
+        f"<li><a href='/pages/forms/?page_num={n}'>{n}</a></li>"
+        for n in range(1, pages + 1)
+    )
+    return (
+        "<html><body><section id='hockey'><div class='container'>"
+        f"<table class='table'><tr>{header}</tr>{body}</table>"
+        f"<ul class='pagination'>{links}</ul>"
+        "</div></section></body></html>"
+    )
+
+
+BRUINS = ["Bruins", "2024", "50", "20", "12", ".650", "280", "220", "60"]
+RANGERS = ["Rangers", "2024", "48", "22", "12", ".610", "270", "230", "40"]
+
+
 def _make_cell(text: str) -> MagicMock:
     cell = MagicMock()
     cell.text = text
@@ -49,7 +76,7 @@ def _make_page_data(rows: list[list[str]]):
 
 @pytest.fixture
 def scraper():
-    return HockeyHistoricScraper(headless=True)
+    return HockeyHistoricScraper(headless=True, extraction="elements")
 
 
 def test_empty_table_returns_empty_list(scraper):
@@ -174,3 +201,269 @@ def test_save_to_database(scraper):
         assert len(historics) == 2
         assert historics[0].year == 2024 and historics[0].wins == 50
         assert historics[1].year == 2024 and historics[1].wins == 48
+
+
+def test_parse_html_reads_hockey_table(scraper):
+    result = scraper.parse_html(_make_html([BRUINS, RANGERS, ["Bruins", "2024"]]))
+
+    assert [r["name"] for r in result] == ["Bruins", "Rangers"]
+    assert result[0]["wins_percentage"] == ".650"
+    assert result[1]["goal_difference"] == "40"
+
+
+def test_html_extraction_uses_single_webdriver_call():
+    scraper = HockeyHistoricScraper(extraction="html")
+    page_data = MagicMock()
+    page_data.get_attribute.return_value = _make_html([BRUINS, RANGERS])
+
+    result = scraper.parse_page_data(page_data)
+
+    assert [r["name"] for r in result] == ["Bruins", "Rangers"]
+    page_data.get_attribute.assert_called_once_with("outerHTML")
+    page_data.find_element.assert_not_called()
+
+
+def test_parse_html_without_table_returns_none(scraper):
+    assert scraper.parse_html("<html><body>Access denied</body></html>") is None
+
+
+def test_http_engine_crawls_all_pages_without_browser():
+    scraper = HockeyHistoricScraper(engine="http")
+    base_url = "https://example.com/pages/forms/"
+    pages = {
+        base_url: _make_html([BRUINS], pages=3),
+        base_url + "?page_num=2": _make_html([RANGERS], pages=3),
+        base_url + "?page_num=3": _make_html([BRUINS], pages=3),
+    }
+
+    with (
+        patch("app.crawlers.crawler.fetch_text", side_effect=lambda u, **_: pages[u]),
+        patch.object(scraper, "save_to_database") as save,
+        patch.object(scraper, "_init_driver") as init_driver,
+    ):
+        with scraper:
+            data = scraper.get_all_historic_data(base_url, job_id="job-1")
+
+    assert [r["name"] for r in data] == ["Bruins", "Rangers", "Bruins"]
+    save.assert_called_once_with(data, "job-1")
+    init_driver.assert_not_called()
+
+
+def test_http_engine_concurrent_pages_keep_page_order():
+    scraper = HockeyHistoricScraper(engine="http", max_concurrency=3)
+    base_url = "https://example.com/pages/forms/"
+    lock = threading.Lock()
+    in_flight = {"now": 0, "max": 0}
+
+    def fake_fetch(url, **_):
+        page = int(url.rsplit("=", 1)[1]) if "=" in url else 1
+        with lock:
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        time.sleep(0.02 * (8 - page))  # later pages finish first
+        with lock:
+            in_flight["now"] -= 1
+        return _make_html([[f"Team {page}", *BRUINS[1:]]], pages=7)
+
+    with (
+        patch("app.crawlers.crawler.fetch_text", side_effect=fake_fetch),
+        patch.object(scraper, "save_to_database") as save,
+    ):
+        data = scraper.get_all_historic_data(base_url, save_per_page=True)
+
+    assert [r["name"] for r in data] == [f"Team {n}" for n in range(1, 8)]
+    # The writer thread may coalesce pages into one batch, but keeps page order
+    saved = [row["name"] for call in save.call_args_list for row in call.args[0]]
+    assert saved == [f"Team {n}" for n in range(1, 8)]
+    assert 1 < in_flight["max"] <= 3
+
+
+def test_auto_engine_falls_back_to_selenium_without_table():
+    scraper = HockeyHistoricScraper(engine="auto")
+
+    def fake_init_driver():
+        scraper.driver = MagicMock()
+
+    with (
+        patch("app.crawlers.crawler.fetch_text", return_value="<html></html>"),
+        patch.object(scraper, "_init_driver", side_effect=fake_init_driver),
+        patch.object(scraper, "_extract_page_data", return_value=[]),
+        patch("app.crawlers.crawler.WebDriverWait"),
+    ):
+        data = scraper.get_all_historic_data("https://example.com/pages/forms/")
+
+    assert data == []
+    scraper.driver.get.assert_called_once_with("https://example.com/pages/forms/")
+
+
+def test_unknown_engine_rejected():
+    with pytest.raises(ValueError):
+        HockeyHistoricScraper(engine="curl")
+
+
+def test_oscar_years_fetched_concurrently_in_year_order():
+    scraper = OscarScraper()
+    years_html = "".join(
+        f'<a href="#" class="year-link" id="{y}">{y}</a>' for y in range(2010, 2016)
+    )
+
+    def fake_fetch(url, **_):
+        if "year=" not in url:
+            return years_html
+        year = int(url.rsplit("=", 1)[1])
+        time.sleep(0.01 * (2016 - year))  # earlier years finish last
+        return f'[{{"title": "Film {year}", "year": {year}, "nominations": 1}}]'
+
+    with patch("app.crawlers.crawler.fetch_text", side_effect=fake_fetch):
+        data = scraper.get_all_oscar_data()
+
+    assert [f["year"] for f in data] == list(range(2010, 2016))
+    assert data[0] == {
+        "title": "Film 2010",
+        "year": 2010,
+        "nominations": 1,
+        "awards": 0,
+        "best_picture": False,
+    }
+
+
+def test_incremental_hockey_skips_unchanged_pages():
+    base_url = "https://example.com/pages/forms/"
+    pages = {
+        base_url: _make_html([BRUINS], pages=3),
+        base_url + "?page_num=2": _make_html([RANGERS], pages=3),
+        base_url + "?page_num=3": _make_html([BRUINS], pages=3),
+    }
+
+    def crawl(scraper):
+        with (
+            patch(
+                "app.crawlers.crawler.fetch_text", side_effect=lambda u, **_: pages[u]
+            ),
+            patch.object(scraper, "save_to_database") as save,
+        ):
+            data = scraper.get_all_historic_data(base_url, job_id="job")
+        return data, save
+
+    first = HockeyHistoricScraper(engine="http", incremental=True)
+    data, _ = crawl(first)
+    assert len(data) == 3 and first.units_refreshed == 3
+    assert set(first.fingerprints) == set(pages)
+
+    # Page 2 changes upstream; pages 1 and 3 are neither parsed nor saved
+    pages[base_url + "?page_num=2"] = _make_html([RANGERS, BRUINS], pages=3)
+    second = HockeyHistoricScraper(
+        engine="http", incremental=True, known_fingerprints=first.fingerprints
+    )
+    with patch.object(second, "parse_html", wraps=second.parse_html) as parse:
+        data, save = crawl(second)
+
+    assert [r["name"] for r in data] == ["Rangers", "Bruins"]
+    save.assert_called_once_with(data, "job")
+    parse.assert_called_once()
+    assert (second.units_skipped, second.units_refreshed) == (2, 1)
+
+
+def test_pages_prefetched_past_early_stop_keep_no_fingerprint():
+    base_url = "https://example.com/pages/forms/"
+    pages = {
+        base_url + f"?page_num={n}": _make_html([BRUINS], pages=5) for n in (2, 4, 5)
+    }
+    pages[base_url] = _make_html([RANGERS], pages=5)
+
+    def fake_fetch(url, **_):
+        if url.endswith("page_num=3"):
+            raise requests.ConnectionError("reset")
+        return pages[url]
+
+    scraper = HockeyHistoricScraper(engine="http", incremental=True, max_concurrency=2)
+    with (
+        patch("app.crawlers.crawler.fetch_text", side_effect=fake_fetch),
+        patch.object(scraper, "save_to_database"),
+    ):
+        data = scraper.get_all_historic_data(base_url, job_id="job")
+
+    # Pages 4 and 5 may have been fetched ahead, but their rows were never
+    # saved: the next incremental run must fetch them again
+    assert len(data) == 2
+    assert set(scraper.fingerprints) == {base_url, base_url + "?page_num=2"}
+
+
+def test_incremental_oscar_skips_unchanged_years():
+    years_html = (
+        '<a class="year-link" id="2010"></a><a class="year-link" id="2011"></a>'
+    )
+    payloads = {
+        2010: '[{"title": "Inception", "year": 2010}]',
+        2011: '[{"title": "The Artist", "year": 2011}]',
+    }
+
+    def fake_fetch(url, **_):
+        return payloads[int(url.rsplit("=", 1)[1])] if "year=" in url else years_html
+
+    with patch("app.crawlers.crawler.fetch_text", side_effect=fake_fetch):
+        first = OscarScraper(incremental=True)
+        first.get_all_oscar_data()
+        payloads[2011] = '[{"title": "The Artist", "year": 2011, "awards": 5}]'
+        second = OscarScraper(incremental=True, known_fingerprints=first.fingerprints)
+        data = second.get_all_oscar_data()
+
+    assert [f["title"] for f in data] == ["The Artist"]
+    assert (second.units_skipped, second.units_refreshed) == (1, 1)
+
+
+def test_non_incremental_crawl_refreshes_everything():
+    payload = '[{"title": "Inception", "year": 2010}]'
+    known = {"year:2010": hashlib.sha256(payload.encode()).hexdigest()}
+    scraper = OscarScraper(known_fingerprints=known)
+
+    with (
+        patch.object(scraper, "get_years", return_value=[2010]),
+        patch("app.crawlers.crawler.fetch_text", return_value=payload),
+    ):
+        data = scraper.get_all_oscar_data()
+
+    assert len(data) == 1 and scraper.units_skipped == 0
+
+
+def test_pages_fetched_while_previous_page_is_saved():
+    scraper = HockeyHistoricScraper(engine="http", max_concurrency=1)
+    base_url = "https://example.com/pages/forms/"
+    page3_fetched = threading.Event()
+    overlapped = []
+
+    def fake_fetch(url, **_):
+        if url.endswith("=3"):
+            page3_fetched.set()
+        return _make_html([BRUINS], pages=3)
+
+    def slow_save(rows, job_id=None):
+        # The first save only completes once the crawler has moved on
+        overlapped.append(page3_fetched.wait(1))
+
+    with (
+        patch("app.crawlers.crawler.fetch_text", side_effect=fake_fetch),
+        patch.object(scraper, "save_to_database", side_effect=slow_save),
+    ):
+        data = scraper.get_all_historic_data(base_url, save_per_page=True)
+
+    assert len(data) == 3
+    assert overlapped[0] is True
+
+
+def test_crawl_historic_data_streams_rows_and_returns_count():
+    scraper = HockeyHistoricScraper(engine="http")
+    base_url = "https://example.com/pages/forms/"
+
+    with (
+        patch(
+            "app.crawlers.crawler.fetch_text",
+            return_value=_make_html([BRUINS, RANGERS], pages=4),
+        ),
+        patch.object(scraper, "save_to_database") as save,
+    ):
+        count = scraper.crawl_historic_data(base_url, job_id="job")
+
+    assert count == 8
+    assert sum(len(call.args[0]) for call in save.call_args_list) == 8
+    assert all(call.args[1] == "job" for call in save.call_args_list)
@@ -0,0 +1,105 @@
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.crawlers.http_cache import CacheStats, HttpCache
+from app.crawlers.http_client import fetch_text
+
+URL = "https://site.test/pages/forms/?page_num=2"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HttpCache(directory=str(tmp_path), max_bytes=1024 * 1024)
+
+
+def _response(status: int, body: bytes = b"", headers: dict | None = None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.content = body
+    resp.text = body.decode()
+    resp.encoding = "utf-8"
+    resp.headers = headers or {}
+    if status >= 400:
+        resp.raise_for_status.side_effect = RuntimeError(status)
+    return resp
+
+
+def _fetch(cache, resp, stats):
+    session = MagicMock()
+    session.get.return_value = resp
+    with (
+        patch("app.crawlers.http_client.get_http_cache", return_value=cache),
+        patch("app.crawlers.http_client.get_http_session", return_value=session),
+    ):
+        return fetch_text(URL, stats=stats), session.get.call_args.kwargs["headers"]
+
+
+def test_not_modified_served_from_cache(cache):
+    stats = CacheStats()
+
+    body, headers = _fetch(
+        cache,
+        _response(200, b"<table/>", {"ETag": '"v1"', "Last-Modified": "Mon"}),
+        stats,
+    )
+    assert body == "<table/>" and headers == {}
+
+    body, headers = _fetch(cache, _response(304), stats)
+    assert body == "<table/>"
+    assert headers == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon"}
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_changed_response_replaces_cached_body(cache):
+    stats = CacheStats()
+    _fetch(cache, _response(200, b"old", {"ETag": '"v1"'}), stats)
+    body, _ = _fetch(cache, _response(200, b"new", {"ETag": '"v2"'}), stats)
+
+    assert body == "new"
+    assert cache.get(URL).etag == '"v2"'
+    assert (stats.hits, stats.misses) == (0, 2)
+
+
+def test_download_counted_as_miss_with_cache_disabled():
+    stats = CacheStats()
+
+    body, headers = _fetch(None, _response(200, b"<html/>"), stats)
+
+    assert body == "<html/>"
+    assert "If-None-Match" not in headers
+    assert (stats.hits, stats.misses) == (0, 1)
+
+
+def test_response_without_validators_not_stored(cache):
+    _fetch(cache, _response(200, b"<table/>"), CacheStats())
+    assert cache.get(URL) is None
+
+
+def test_least_recently_used_entries_evicted(tmp_path):
+    cache = HttpCache(directory=str(tmp_path), max_bytes=500)  # ~212 B per entry
+    for n, mtime in ((1, 100), (2, 200)):
+        cache.put(f"{URL}{n}", b"x" * 100, etag=f'"{n}"')
+        os.utime(cache._path(f"{URL}{n}"), (mtime, mtime))
+    cache.touch(f"{URL}1")  # 1 is now the most recently used
+
+    cache.put(f"{URL}3", b"x" * 100, etag='"3"')
+
+    assert cache.get(f"{URL}1") is not None
+    assert cache.get(f"{URL}2") is None
+    assert cache.get(f"{URL}3") is not None
+
+
+def test_entry_replaced_in_one_file(cache):
+    cache.put(URL, b"old", etag='"v1"')
+    cache.put(URL, b"new", etag='"v2"')
+
+    entry = cache.get(URL)
+    assert (entry.body, entry.etag) == (b"new", '"v2"')
+    assert os.listdir(cache.directory) == [os.path.basename(cache._path(URL))]
+
+
+def test_body_with_newlines_round_trips(cache):
+    cache.put(URL, b"<table>\n<tr/>\n</table>\n", last_modified="Mon")
+    assert cache.get(URL).body == b"<table>\n<tr/>\n</table>\n"
@@ -140,3 +140,118 @@ def test_api_create_job_over_container_db(integration_engine, rabbitmq_url):
             assert jobs[0]["job_id"] == data["job_id"]
         finally:
             app.dependency_overrides.pop(get_session, None)
+
+
+def test_copy_ingest_over_container_db(integration_engine):
+    """COPY ingestion stages rows and merges them into the real tables."""
+    from sqlalchemy.orm import sessionmaker
+
+    from app.crawlers.crawler import HockeyHistoricScraper, OscarScraper
+    from app.models.films import Film, OscarWinnerFilm
+    from app.models.hockey_teams import HockeyTeam, HockeyTeamHistoric
+
+    session_factory = sessionmaker(
+        autocommit=False, autoflush=False, bind=integration_engine
+    )
+    hockey = [
+        {
+            "name": name,
+            "year": "1990",
+            "wins": "44",
+            "losses": "24",
+            "losses_ot": "",
+            "wins_percentage": ".537",
+            "goals_for": "251",
+            "goals_against": "229",
+            "goal_difference": "22",
+        }
+        for name in ("Bruins", "Rangers", "Bruins")
+    ]
+    films = [
+        {"title": "Spotlight", "year": 2015, "nominations": 6, "awards": 2,
+         "best_picture": True},
+        {"title": "Mad Max: Fury Road", "year": 2015, "nominations": 10,
+         "awards": 6},
+    ]  # fmt: skip
+
+    with patch("app.crawlers.crawler.Session", session_factory):
+        HockeyHistoricScraper(ingest="copy").save_to_database(hockey, "job-h")
+        OscarScraper(ingest="copy").save_to_database(films, "job-o")
+        OscarScraper(ingest="copy").save_to_database(films[:1], "job-o2")
+
+    with session_factory() as session:
+        assert session.query(HockeyTeam).count() == 2
+        historic = session.query(HockeyTeamHistoric).order_by("id").all()
+        # (Bruins, 1990) appears twice in the batch → upserted once
+        assert [h.team.name for h in historic] == ["Rangers", "Bruins"]
+        assert historic[0].losses_ot == 0
+        assert {h.job_id for h in historic} == {"job-h"}
+
+        assert session.query(Film).count() == 2
+        oscars = session.query(OscarWinnerFilm).order_by("id").all()
+        assert [o.film.title for o in oscars] == ["Spotlight", "Mad Max: Fury Road"]
+        assert oscars[0].best_picture is True and oscars[1].best_picture is False
+        # Re-saved by the second job → updated in place
+        assert [o.job_id for o in oscars] == ["job-o2", "job-o"]
+
+
+def test_unique_constraint_upgrade_races_safely(integration_engine):
+    """Concurrent init_db runs merge duplicates once; the losers do nothing."""
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from sqlalchemy import inspect, text
+
+    from app.database import ensure_unique_constraints
+
+    with integration_engine.begin() as conn:
+        # Database from before the constraints, with duplicates
+        conn.execute(
+            text("ALTER TABLE hockey_team DROP CONSTRAINT hockey_team_name_key")
+        )
+        conn.execute(
+            text(
+                "ALTER TABLE hockey_team_historic "
+                "DROP CONSTRAINT uq_hockey_team_historic_team_year"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO hockey_team (id, name) VALUES "
+                "(1, 'Bruins'), (2, 'Rangers'), (3, 'Bruins')"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO hockey_team_historic "
+                "(id, team_id, year, wins, losses, losses_ot, wins_percentage, "
+                "goals_for, goals_against, goal_difference) VALUES "
+                "(1, 1, 1990, 40, 0, 0, 0, 0, 0, 0), "
+                "(2, 2, 1990, 30, 0, 0, 0, 0, 0, 0), "
+                "(3, 3, 1990, 44, 0, 0, 0, 0, 0, 0), "
+                "(4, 1, 1991, 50, 0, 0, 0, 0, 0, 0)"
+            )
+        )
+
+    start = threading.Barrier(4)
+
+    def init_db_run():
+        start.wait()
+        ensure_unique_constraints(integration_engine)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        runs = [pool.submit(init_db_run) for _ in range(4)]
+        for run in runs:
+            run.result()  # no "relation already exists" in any of them
+
+    with integration_engine.connect() as conn:
+        teams = conn.execute(text("SELECT id, name FROM hockey_team ORDER BY id"))
+        assert teams.all() == [(2, "Rangers"), (3, "Bruins")]
+        historic = conn.execute(
+            text("SELECT id, team_id, year FROM hockey_team_historic ORDER BY id")
+        )
+        assert historic.all() == [(2, 2, 1990), (3, 3, 1990), (4, 3, 1991)]
+    inspector = inspect(integration_engine)
+    assert {"hockey_team_name_key"} == {
+        uc["name"] for uc in inspector.get_unique_constraints("hockey_team")
+    }
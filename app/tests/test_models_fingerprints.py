@@ -0,0 +1,41 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.database import Base
+from app.models.fingerprints import CrawlFingerprint
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+    with session_factory() as session:
+        yield session
+    Base.metadata.drop_all(engine)
+
+
+class TestCrawlFingerprint:
+    def test_load_empty_source(self, session: Session):
+        assert CrawlFingerprint.load(session, "hockey") == {}
+
+    def test_store_inserts_and_updates(self, session: Session):
+        CrawlFingerprint.store(session, "hockey", {"p1": "aaa", "p2": "bbb"}, "job-1")
+        session.commit()
+        CrawlFingerprint.store(session, "hockey", {"p2": "ccc", "p3": "ddd"}, "job-2")
+        session.commit()
+
+        assert CrawlFingerprint.load(session, "hockey") == {
+            "p1": "aaa",
+            "p2": "ccc",
+            "p3": "ddd",
+        }
+        assert session.query(CrawlFingerprint).count() == 3
+
+    def test_sources_are_isolated(self, session: Session):
+        CrawlFingerprint.store(session, "hockey", {"u": "aaa"})
+        CrawlFingerprint.store(session, "oscar", {"u": "bbb"})
+        session.commit()
+
+        assert CrawlFingerprint.load(session, "oscar") == {"u": "bbb"}
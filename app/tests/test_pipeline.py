@@ -0,0 +1,93 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.crawlers.pipeline import PageWriter, ordered_map
+
+
+def test_writer_saves_all_pages_in_order():
+    saved = []
+
+    with PageWriter(saved.extend, max_pages=2) as writer:
+        for page in range(10):
+            writer.put([page * 2, page * 2 + 1])
+
+    assert saved == list(range(20))
+    assert writer.pages_written == 10
+
+
+def test_writer_coalesces_queued_pages_into_batches():
+    batches = []
+    release = threading.Event()
+
+    def slow_save(rows):
+        release.wait(1)
+        batches.append(rows)
+
+    with PageWriter(slow_save, max_pages=10, batch_pages=3) as writer:
+        for page in range(7):
+            writer.put([page])
+        release.set()
+
+    assert [row for batch in batches for row in batch] == list(range(7))
+    assert max(len(batch) for batch in batches) == 3
+    assert writer.batches_written < 7
+
+
+def test_put_blocks_when_queue_is_full():
+    release = threading.Event()
+    writer = PageWriter(lambda rows: release.wait(1), max_pages=1, batch_pages=1)
+    writer.put([1])  # taken by the writer, blocked in save
+    time.sleep(0.05)
+    writer.put([2])  # fills the queue
+
+    blocked = threading.Thread(target=writer.put, args=([3],))
+    blocked.start()
+    blocked.join(0.2)
+    assert blocked.is_alive()  # back-pressure
+
+    release.set()
+    blocked.join(1)
+    writer.close()
+    assert writer.pages_written == 3
+
+
+def test_writer_error_stops_producer_and_is_raised():
+    def failing_save(rows):
+        raise ValueError("db down")
+
+    writer = PageWriter(failing_save, max_pages=1, batch_pages=1)
+    with pytest.raises(ValueError, match="db down"):
+        for page in range(100):
+            writer.put([page])
+    with pytest.raises(ValueError):
+        writer.close()
+
+
+def test_pages_dropped_when_producer_fails():
+    saved = []
+
+    with pytest.raises(RuntimeError):
+        with PageWriter(saved.extend, max_pages=5) as writer:
+            writer.put([1])
+            raise RuntimeError("crawl failed")
+
+    assert saved in ([], [1])
+
+
+def test_ordered_map_keeps_order_and_bounds_prefetch():
+    started = []
+
+    def work(n):
+        started.append(n)
+        time.sleep(0.01 * (5 - n % 5))
+        return n * 10
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = ordered_map(pool, work, range(20), window=3)
+        assert next(results) == 0
+        time.sleep(0.1)
+        assert len(started) <= 4  # window + the one submitted on consumption
+        assert list(results) == [n * 10 for n in range(1, 20)]
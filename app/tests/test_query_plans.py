@@ -0,0 +1,217 @@
+"""
+Query-plan regression suite (Testcontainers PostgreSQL).
+
+Every SQL statement issued by the read endpoints is captured and re-run with
+``EXPLAIN`` against a seeded database, with ``enable_seqscan = off`` so the
+planner only falls back to a sequential scan when no index can serve the
+query. Any ``Seq Scan`` in a plan fails the test.
+
+Requires Docker. Run with: pytest app/tests/test_query_plans.py -v
+"""
+
+import asyncio
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+pytestmark = pytest.mark.integration
+
+
+def _seed(session_factory) -> dict:
+    from app.models.films import Film, OscarWinnerFilm
+    from app.models.hockey_teams import HockeyTeam, HockeyTeamHistoric
+    from app.models.jobs import Job, JobStatus, JobType
+
+    now = datetime.now(timezone.utc)
+    with session_factory() as session:
+        jobs = [
+            Job(
+                job_id=f"job-{i}",
+                job_type=JobType.HOCKEY if i % 2 else JobType.OSCAR,
+                status=JobStatus.COMPLETED if i % 3 else JobStatus.FAILED,
+                created_at=now - timedelta(minutes=i),
+            )
+            for i in range(50)
+        ]
+        teams = [HockeyTeam(name=f"Team {i}") for i in range(20)]
+        films = [Film(title=f"Film {i}") for i in range(20)]
+        session.add_all(jobs + teams + films)
+        session.flush()
+
+        session.add_all(
+            HockeyTeamHistoric(
+                team_id=team.id,
+                year=1990 + year,
+                wins=40,
+                losses=30,
+                losses_ot=10,
+                wins_percentage=0.5,
+                goals_for=250,
+                goals_against=240,
+                goal_difference=10,
+                job_id=f"job-{2 * (year % 25) + 1}",
+            )
+            for team in teams
+            for year in range(20)
+        )
+        session.add_all(
+            OscarWinnerFilm(
+                film_id=film.id,
+                year=2000 + year,
+                nominations=5,
+                awards=2,
+                best_picture=False,
+                job_id=f"job-{2 * (year % 25)}",
+            )
+            for film in films
+            for year in range(5)
+        )
+        session.commit()
+    return {"hockey_job": "job-1", "oscar_job": "job-2"}
+
+
+@contextmanager
+def _captured_selects(*engines):
+    """Capture (engine, statement, parameters) of the SELECTs run on ``engines``."""
+    from sqlalchemy import event
+
+    statements = []
+    listeners = []
+
+    def capture_for(engine):
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append((engine, statement, parameters))
+
+        return capture
+
+    for engine in engines:
+        sync_engine = getattr(engine, "sync_engine", engine)
+        capture = capture_for(engine)
+        event.listen(sync_engine, "before_cursor_execute", capture)
+        listeners.append((sync_engine, capture))
+    try:
+        yield statements
+    finally:
+        for sync_engine, capture in listeners:
+            event.remove(sync_engine, "before_cursor_execute", capture)
+
+
+async def _async_plan(engine, statement, parameters) -> str:
+    # asyncpg statements use $n placeholders: EXPLAIN them through asyncpg
+    async with engine.connect() as conn:
+        await conn.exec_driver_sql("SET enable_seqscan = off")
+        result = await conn.exec_driver_sql("EXPLAIN " + statement, tuple(parameters))
+        plan = "\n".join(row[0] for row in result)
+        await conn.rollback()
+        return plan
+
+
+def _plan(engine, statement, parameters) -> str:
+    if hasattr(engine, "sync_engine"):
+        return asyncio.run(_async_plan(engine, statement, parameters))
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        cursor.execute("SET enable_seqscan = off")
+        cursor.execute("EXPLAIN " + statement, parameters)
+        return "\n".join(row[0] for row in cursor.fetchall())
+    finally:
+        raw.rollback()
+        raw.close()
+
+
+@pytest.fixture
+def integration_async_engine(integration_engine):
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import NullPool
+
+    from app.database import async_database_url
+
+    # NullPool: TestClient and _plan run on different event loops
+    engine = create_async_engine(
+        async_database_url(
+            integration_engine.url.render_as_string(hide_password=False)
+        ),
+        poolclass=NullPool,
+    )
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def api_client(integration_engine, integration_async_engine):
+    from fastapi.testclient import TestClient
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import sessionmaker
+
+    from app.database import get_async_session, get_session
+    from app.main import _job_results_cache, _listing_cache, app
+
+    session_factory = sessionmaker(
+        autocommit=False, autoflush=False, bind=integration_engine
+    )
+    ids = _seed(session_factory)
+    with integration_engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+
+    def override_get_session():
+        session = session_factory()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+
+    # Cache hits would hide the statements under test
+    _job_results_cache.clear()
+    _listing_cache.clear()
+
+    async def override_get_async_session():
+        async with AsyncSession(
+            integration_async_engine, expire_on_commit=False
+        ) as session:
+            yield session
+            await session.commit()
+
+    app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_async_session] = override_get_async_session
+    with patch("app.database.engine", integration_engine):
+        try:
+            yield TestClient(app), ids
+        finally:
+            app.dependency_overrides.pop(get_session, None)
+            app.dependency_overrides.pop(get_async_session, None)
+
+
+ENDPOINTS = [
+    "/jobs",
+    "/jobs?status=completed",
+    "/jobs/{hockey_job}",
+    "/jobs/{hockey_job}/results",
+    "/jobs/{oscar_job}/results",
+    "/results/hockey?limit=20",
+    "/results/oscar?limit=20",
+    "/export/hockey",
+    "/export/oscar?format=csv",
+    "/jobs/{hockey_job}/export",
+]
+
+
+@pytest.mark.parametrize("path", ENDPOINTS)
+def test_endpoint_queries_use_indexes(
+    api_client, integration_engine, integration_async_engine, path
+):
+    client, ids = api_client
+
+    with _captured_selects(integration_engine, integration_async_engine) as captured:
+        response = client.get(path.format(**ids))
+    assert response.status_code == 200
+    assert captured, f"no SQL captured for {path}"
+
+    for engine, statement, parameters in captured:
+        plan = _plan(engine, statement, parameters)
+        assert "Seq Scan" not in plan, f"{path}: sequential scan\n{statement}\n{plan}"
@@ -0,0 +1,93 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from app.crawlers import ratelimit
+from app.crawlers.crawler import Scraper
+from app.crawlers.http_client import fetch_text
+from app.crawlers.ratelimit import RateLimiter
+
+
+def test_burst_passes_without_waiting():
+    limiter = RateLimiter(rate=1, burst=5)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    assert time.monotonic() - start < 0.05
+
+
+def test_requests_paced_after_burst():
+    limiter = RateLimiter(rate=50, burst=1)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+    # 1 immediate + 5 paced at 20 ms each
+    assert time.monotonic() - start >= 0.09
+
+
+def test_zero_rate_disables_limiting():
+    limiter = RateLimiter(rate=0)
+    start = time.monotonic()
+    for _ in range(100):
+        limiter.acquire()
+    assert time.monotonic() - start < 0.05
+
+
+def test_max_concurrency_bounds_requests_in_flight():
+    limiter = RateLimiter(rate=0, max_concurrency=2)
+    lock = threading.Lock()
+    in_flight = {"now": 0, "max": 0}
+
+    def request():
+        with limiter:
+            with lock:
+                in_flight["now"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            time.sleep(0.01)
+            with lock:
+                in_flight["now"] -= 1
+
+    threads = [threading.Thread(target=request) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert in_flight["max"] == 2
+
+
+def test_hosts_share_limiter_with_strictest_config(monkeypatch):
+    monkeypatch.setattr(
+        ratelimit,
+        "SCRAPER_URLS",
+        {
+            "a": {"url": "https://site.test/a/", "rate": 5, "burst": 5},
+            "b": {"url": "https://site.test/b/", "rate": 2, "max_concurrency": 3},
+        },
+    )
+    monkeypatch.setattr(ratelimit, "_limiters", {})
+
+    limiter = ratelimit.get_limiter("https://site.test/a/?page_num=2")
+
+    assert limiter is ratelimit.get_limiter("https://site.test/b/?year=2010")
+    assert (limiter.rate, limiter.burst, limiter.max_concurrency) == (2, 1, 3)
+    assert ratelimit.get_limiter("https://other.test/").rate == 0
+
+
+def test_http_and_selenium_requests_go_through_host_limiter():
+    limiter = MagicMock()
+    with (
+        patch("app.crawlers.http_client.get_limiter", return_value=limiter) as http,
+        patch("app.crawlers.http_client.get_http_session"),
+        patch("app.crawlers.http_client.get_http_cache", return_value=None),
+    ):
+        fetch_text("https://site.test/page")
+    http.assert_called_once_with("https://site.test/page")
+    limiter.__enter__.assert_called_once()
+
+    scraper = Scraper()
+    scraper.driver = MagicMock()
+    with patch("app.crawlers.crawler.get_limiter", return_value=limiter) as nav:
+        scraper._navigate("https://site.test/other")
+    nav.assert_called_once_with("https://site.test/other")
+    assert limiter.__enter__.call_count == 2
@@ -0,0 +1,50 @@
+import json
+from datetime import datetime, timezone
+from typing import List
+from unittest.mock import patch
+
+from typing_extensions import TypedDict
+
+from app.models.jobs import JobStatus
+from app.responses import dumps, json_response, type_adapter, validate
+
+
+class Row(TypedDict):
+    id: int
+    score: float
+
+
+def test_type_adapter_is_built_once_per_type():
+    assert type_adapter(List[Row]) is type_adapter(List[Row])
+
+
+def test_validate_coerces_and_drops_unknown_keys():
+    rows = validate(List[Row], [{"id": "1", "score": 2, "extra": "x"}])
+
+    assert rows == [{"id": 1, "score": 2.0}]
+    assert type(rows[0]) is dict
+
+
+def test_dumps_stdlib_fallback_matches_orjson():
+    content = {
+        "at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "status": JobStatus.COMPLETED,
+        "title": "Parasita — Gisaengchung",
+        "rows": [{"id": 1, "score": 0.5}, None],
+    }
+
+    fast = dumps(content)
+    with patch("app.responses.orjson", None):
+        fallback = dumps(content)
+
+    assert json.loads(fast) == json.loads(fallback)
+    assert json.loads(fallback)["at"] == "2024-01-02T03:04:05+00:00"
+    assert json.loads(fallback)["status"] == "completed"
+
+
+def test_json_response_validates_once_and_renders():
+    response = json_response(List[Row], [{"id": 1, "score": "0.25"}], {"X-A": "1"})
+
+    assert json.loads(response.body) == [{"id": 1, "score": 0.25}]
+    assert response.headers["X-A"] == "1"
+    assert response.media_type == "application/json"
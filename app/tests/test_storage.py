@@ -0,0 +1,211 @@
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.crawlers.crawler import HockeyHistoricScraper, OscarScraper
+from app.crawlers.storage import _CsvStream, id_cache, resolve_ids
+from app.database import Base
+from app.models.films import Film, OscarWinnerFilm
+from app.models.hockey_teams import HockeyTeam, HockeyTeamHistoric
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.drop_all(engine)
+
+
+def _count_statements(engine) -> list:
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    return statements
+
+
+def _rows(n: int, teams: int) -> list:
+    return [
+        {
+            "name": f"Team {i % teams}",
+            "year": str(1990 + i),
+            "wins": "40",
+            "losses": "30",
+            "losses_ot": "",
+            "wins_percentage": ".500",
+            "goals_for": "250",
+            "goals_against": "240",
+            "goal_difference": "10",
+        }
+        for i in range(n)
+    ]
+
+
+def test_resolve_ids_reuses_existing_and_creates_missing(session_factory):
+    with session_factory() as session:
+        session.add(HockeyTeam(name="Bruins"))
+        session.commit()
+        bruins_id = session.query(HockeyTeam.id).scalar()
+
+        ids = resolve_ids(session, HockeyTeam.name, ["Bruins", "Rangers", "Rangers"])
+        session.commit()
+
+        assert ids["Bruins"] == bruins_id
+        assert set(ids) == {"Bruins", "Rangers"}
+        assert session.query(HockeyTeam).count() == 2
+
+
+def test_save_to_database_uses_constant_number_of_statements(session_factory):
+    scraper = HockeyHistoricScraper(engine="http")
+    statements = _count_statements(session_factory.kw["bind"])
+
+    with patch("app.crawlers.crawler.Session", session_factory):
+        scraper.save_to_database(_rows(600, teams=30), job_id="job")
+
+    # lookup + team insert + one executemany for the historic rows
+    assert len([s for s in statements if "hockey_team" in s]) == 3
+    with session_factory() as session:
+        assert session.query(HockeyTeam).count() == 30
+        historic = session.query(HockeyTeamHistoric).all()
+        assert len(historic) == 600
+        assert {h.job_id for h in historic} == {"job"}
+        assert historic[0].losses_ot == 0  # empty cell → default
+
+
+def test_save_to_database_upserts_across_jobs(session_factory):
+    scraper = HockeyHistoricScraper(engine="http")
+    updated = _rows(10, teams=5)
+    updated[0]["wins"] = "50"
+
+    with patch("app.crawlers.crawler.Session", session_factory):
+        scraper.save_to_database(_rows(10, teams=5), job_id="job-1")
+        scraper.save_to_database(updated, job_id="job-2")
+
+    with session_factory() as session:
+        assert session.query(HockeyTeam).count() == 5
+        historic = session.query(HockeyTeamHistoric).order_by("id").all()
+        assert len(historic) == 10  # same (team, year) keys → updated in place
+        assert {h.job_id for h in historic} == {"job-2"}
+        assert historic[0].wins == 50
+
+
+def test_duplicate_keys_in_one_batch_keep_last_row(session_factory):
+    scraper = HockeyHistoricScraper(engine="http")
+    rows = _rows(2, teams=1)
+    rows[1]["year"] = rows[0]["year"]
+    rows[1]["wins"] = "12"
+
+    with patch("app.crawlers.crawler.Session", session_factory):
+        scraper.save_to_database(rows, job_id="job")
+
+    with session_factory() as session:
+        assert [h.wins for h in session.query(HockeyTeamHistoric)] == [12]
+
+
+def test_copy_ingest_falls_back_to_orm_without_postgres(session_factory):
+    scraper = HockeyHistoricScraper(engine="http", ingest="copy")
+
+    with (
+        patch("app.crawlers.crawler.Session", session_factory),
+        patch("app.crawlers.crawler.copy_hockey_historic") as copy,
+    ):
+        scraper.save_to_database(_rows(10, teams=5), job_id="job")
+
+    copy.assert_not_called()
+    with session_factory() as session:
+        assert session.query(HockeyTeamHistoric).count() == 10
+
+
+def test_unknown_ingest_rejected():
+    with pytest.raises(ValueError):
+        OscarScraper(ingest="bulk")
+
+
+def test_csv_stream_encodes_rows_in_chunks():
+    rows = [(1, "Bruins, Boston", None, True), (2, 'The "Rangers"', 3.5, False)]
+    stream = _CsvStream(iter(rows))
+
+    chunks = []
+    while chunk := stream.read(7):
+        chunks.append(chunk)
+
+    assert all(len(c) <= 7 for c in chunks)
+    assert "".join(chunks) == (
+        '1,"Bruins, Boston",,True\n2,"The ""Rangers""",3.5,False\n'
+    )
+
+
+def _films(*titles: str) -> list:
+    return [
+        {
+            "title": t,
+            "year": 2010 + i,
+            "nominations": 3,
+            "awards": 1,
+            "best_picture": i == 0,
+        }
+        for i, t in enumerate(titles)
+    ]
+
+
+def test_oscar_save_resolves_films_in_bulk(session_factory):
+    scraper = OscarScraper()
+    with session_factory() as session:
+        session.add(Film(title="Spotlight"))
+        session.commit()
+    statements = _count_statements(session_factory.kw["bind"])
+
+    with patch("app.crawlers.crawler.Session", session_factory):
+        scraper.save_to_database(
+            _films("Spotlight", "The Revenant", "Room", "Spotlight"), job_id="job"
+        )
+
+    # film lookup + one insert for the missing films + one executemany
+    assert len([s for s in statements if "films" in s]) == 3
+    with session_factory() as session:
+        assert session.query(Film).count() == 3
+        rows = session.query(OscarWinnerFilm).order_by(OscarWinnerFilm.id).all()
+        assert [r.film.title for r in rows] == [
+            "Spotlight",
+            "The Revenant",
+            "Room",
+            "Spotlight",
+        ]
+        assert [r.best_picture for r in rows] == [True, False, False, False]
+
+
+def test_oscar_save_skips_lookup_for_cached_titles(session_factory):
+    scraper = OscarScraper()
+
+    with patch("app.crawlers.crawler.Session", session_factory):
+        scraper.save_to_database(_films("Spotlight", "Room"), job_id="job-1")
+        statements = _count_statements(session_factory.kw["bind"])
+        scraper.save_to_database(_films("Spotlight", "Room"), job_id="job-2")
+
+    # Only the OscarWinnerFilm insert: both titles came from the id cache
+    assert [s.split()[0] for s in statements if "films" in s] == ["INSERT"]
+    with session_factory() as session:
+        assert session.query(Film).count() == 2
+        rows = session.query(OscarWinnerFilm).all()
+        assert len(rows) == 2 and {r.job_id for r in rows} == {"job-2"}
+        cache = id_cache(session, Film.title)
+        assert set(cache.get_many(["Spotlight", "Room"])) == {"Spotlight", "Room"}
+
+
+def test_id_cache_not_filled_when_transaction_fails(session_factory):
+    scraper = OscarScraper()
+
+    # Film is inserted, then the row without a year fails the transaction
+    with (
+        patch("app.crawlers.crawler.Session", session_factory),
+        pytest.raises(KeyError),
+    ):
+        scraper.save_to_database([{"title": "Spotlight"}], job_id="job")
+
+    with session_factory() as session:
+        assert len(id_cache(session, Film.title)) == 0
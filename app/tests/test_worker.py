@@ -0,0 +1,58 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.crawlers.http_cache import CacheStats
+from app.database import Base
+from app.models.fingerprints import CrawlFingerprint
+from app.models.jobs import Job, JobStatus, JobType
+from app.worker import process_job
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.drop_all(engine)
+
+
+def _run_oscar_job(session_factory, store=None):
+    with session_factory() as session:
+        session.add(Job(job_id="job-1", job_type=JobType.OSCAR))
+        session.commit()
+    scraper = MagicMock(units_skipped=0, units_refreshed=1, fingerprints={"u": "f"})
+    scraper.get_all_oscar_data.return_value = []
+    scraper.cache_stats = CacheStats()
+    scraper.cache_stats.hits, scraper.cache_stats.misses = 2, 3
+    store = store or CrawlFingerprint.store.__func__
+    with (
+        patch("app.worker.Session", session_factory),
+        patch("app.worker.OscarScraper", return_value=scraper),
+        patch.object(CrawlFingerprint, "store", classmethod(store)),
+    ):
+        process_job("job-1", "oscar")
+    with session_factory() as session:
+        return session.query(Job).filter(Job.job_id == "job-1").one()
+
+
+def test_completed_job_stores_fingerprints(session_factory):
+    job = _run_oscar_job(session_factory)
+
+    assert job.status == JobStatus.COMPLETED
+    assert (job.http_cache_hits, job.http_cache_misses) == (2, 3)
+    with session_factory() as session:
+        assert CrawlFingerprint.load(session, "oscar") == {"u": "f"}
+
+
+def test_failed_completion_commit_marks_job_failed(session_factory):
+    def conflicting_store(cls, session, *args, **kwargs):
+        # e.g. a unique violation raised by the completion commit
+        session.add(Job(job_id="job-1", job_type=JobType.OSCAR))
+
+    job = _run_oscar_job(session_factory, store=conflicting_store)
+
+    assert job.status == JobStatus.FAILED
+    assert "IntegrityError" in job.error_message
@@ -8,22 +8,36 @@ import sys
 import traceback
 from datetime import datetime
 
-from app.config import SCRAPER_URLS
+from app.config import CRAWL_INCREMENTAL, HOCKEY_ENGINE, SCRAPER_INGEST, SCRAPER_URLS
+from app.crawlers.browser import DriverPool, resolve_chromedriver
 from app.crawlers.crawler import HockeyHistoricScraper, OscarScraper
 from app.database import Session
+from app.models.fingerprints import CrawlFingerprint
 from app.models.jobs import Job, JobStatus
+from app.models.snapshots import JobSnapshot
 from app.queue import consume_jobs
+from app.results import build_snapshot
 
+# Chrome drivers kept alive across jobs of this worker process
+driver_pool = DriverPool(headless=True)
 
-def process_job(job_id: str, job_type: str):
+
+def process_job(
+    job_id: str,
+    job_type: str,
+    incremental: bool = False,
+    ingest: str = SCRAPER_INGEST,
+):
     """
     Process a single crawl job.
 
     Args:
         job_id: Unique job identifier
         job_type: Type of job ('hockey' or 'oscar')
+        incremental: Skip pages/years unchanged since the last successful job
+        ingest: DB ingestion backend ('orm' or 'copy')
     """
-    print(f" [→] Processing job {job_id} ({job_type})")
+    print(f" [→] Processing job {job_id} ({job_type}, ingest={ingest})")
 
     with Session() as session:
         # Get job from database
@@ -38,16 +52,31 @@ def process_job(job_id: str, job_type: str):
         session.commit()
 
         try:
+            known_fingerprints = (
+                CrawlFingerprint.load(session, job_type) if incremental else {}
+            )
+
             if job_type == "hockey":
                 # Run Hockey scraper
                 url = SCRAPER_URLS["hockey"]["url"]
-                with HockeyHistoricScraper(headless=True) as scraper:
-                    data = scraper.get_all_historic_data(url, job_id=job_id)
-                    results_count = len(data)
+                with HockeyHistoricScraper(
+                    headless=True,
+                    driver_pool=driver_pool,
+                    incremental=incremental,
+                    known_fingerprints=known_fingerprints,
+                    ingest=ingest,
+                ) as scraper:
+                    # Pages are persisted by a writer thread while crawling;
+                    # rows are streamed, not collected
+                    results_count = scraper.crawl_historic_data(url, job_id=job_id)
 
             elif job_type == "oscar":
                 # Run Oscar scraper (uses AJAX API directly, no Selenium needed)
-                scraper = OscarScraper()
+                scraper = OscarScraper(
+                    incremental=incremental,
+                    known_fingerprints=known_fingerprints,
+                    ingest=ingest,
+                )
                 data = scraper.get_all_oscar_data()
                 scraper.save_to_database(data, job_id=job_id)
                 results_count = len(data)
@@ -55,17 +84,29 @@ def process_job(job_id: str, job_type: str):
             else:
                 raise ValueError(f"Unknown job type: {job_type}")
 
-            # Update job status to completed
+            # Update job status to completed (fingerprints only from successful jobs)
             job.status = JobStatus.COMPLETED
             job.completed_at = datetime.utcnow()
             job.results_count = results_count
+            job.units_skipped = scraper.units_skipped
+            job.units_refreshed = scraper.units_refreshed
+            job.http_cache_hits = scraper.cache_stats.hits
+            job.http_cache_misses = scraper.cache_stats.misses
+            CrawlFingerprint.store(session, job_type, scraper.fingerprints, job_id)
             session.commit()
 
             print(f" [✓] Job {job_id} completed successfully ({results_count} results)")
+            store_snapshot(session, job)
+            print(
+                f" [i] Job {job_id}: {scraper.units_refreshed} units refreshed, "
+                f"{scraper.units_skipped} skipped; HTTP cache: {scraper.cache_stats}"
+            )
 
         except Exception as e:
-            # Update job status to failed
+            # Update job status to failed (after discarding the failed
+            # transaction, e.g. a completion commit that raised)
             error_msg = f"{type(e).__name__}: {str(e)}\n{traceback.format_exc()}"
+            session.rollback()
             job.status = JobStatus.FAILED
             job.completed_at = datetime.utcnow()
             job.error_message = error_msg
@@ -74,6 +115,19 @@ def process_job(job_id: str, job_type: str):
             print(f" [✗] Job {job_id} failed: {error_msg}")
 
 
+def store_snapshot(session, job: Job) -> None:
+    """
+    Materialize the final results payload of a completed job. Best effort:
+    without a snapshot the API builds the payload from the results tables.
+    """
+    try:
+        JobSnapshot.store(session, job.job_id, build_snapshot(session, job))
+        session.commit()
+    except Exception as e:
+        session.rollback()
+        print(f" [!] Job {job.job_id}: results snapshot not stored: {e}")
+
+
 def callback(ch, method, properties, body):
     """
     RabbitMQ callback function.
@@ -89,6 +143,8 @@ def callback(ch, method, properties, body):
         message = json.loads(body)
         job_id = message.get("job_id")
         job_type = message.get("job_type")
+        incremental = bool(message.get("incremental", CRAWL_INCREMENTAL))
+        ingest = message.get("ingest") or SCRAPER_INGEST
 
         if not job_id or not job_type:
             print(f" [!] Invalid message: {message}")
@@ -96,7 +152,7 @@ def callback(ch, method, properties, body):
             return
 
         # Process job
-        process_job(job_id, job_type)
+        process_job(job_id, job_type, incremental=incremental, ingest=ingest)
 
         # Acknowledge message
         ch.basic_ack(delivery_tag=method.delivery_tag)
@@ -111,6 +167,14 @@ def callback(ch, method, properties, body):
 def main():
     """Main worker loop"""
     print(" [*] Starting crawler worker...")
+
+    chromedriver_path = resolve_chromedriver()
+    print(f" [*] chromedriver: {chromedriver_path or 'PATH'}")
+
+    if HOCKEY_ENGINE == "selenium":
+        print(f" [*] Warming {driver_pool.size} Chrome driver(s)...")
+        driver_pool.warm()
+
     print(" [*] Connecting to RabbitMQ...")
 
     try:
@@ -122,6 +186,8 @@ def main():
         print(f"\n [!] Worker error: {e}")
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        driver_pool.close()
 
 
 if __name__ == "__main__":
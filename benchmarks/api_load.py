@@ -0,0 +1,278 @@
+"""
+Load test: latency (p50/p99) and throughput of the read endpoints under many
+concurrent clients, before/after the async database engine.
+
+"sync" serves the endpoints with the former handlers (sync ``def`` on the
+threadpool, psycopg2 pool); "async" is the current app (``async def``
+handlers on an asyncpg engine). Each mode runs uvicorn in its own process;
+the clients share one ``httpx.AsyncClient`` in this process. The in-process
+result caches are disabled (``--cache`` keeps them) so every request reaches
+the database.
+
+Usage:
+    python -m benchmarks.api_load [--clients 500] [--requests 5000]
+                                  [--rows 600] [--mode sync async]
+                                  [--url postgresql://user:pw@host/db]
+
+Defaults to a temporary SQLite file (aiosqlite for the async mode); use
+``--url`` for representative numbers. Tables are dropped and recreated on
+``--url``, so don't point it at a database holding real data.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import resource
+import socket
+import statistics
+import tempfile
+import time
+from collections import Counter
+from typing import List, Optional
+
+import app.models.films  # noqa: F401 (tables for create_all)
+import app.models.fingerprints  # noqa: F401
+import app.models.jobs  # noqa: F401
+import app.models.snapshots  # noqa: F401
+import httpx
+from app.config import DB_MAX_OVERFLOW, DB_POOL_SIZE
+from app.database import Base
+from app.models.hockey_teams import HockeyTeam, HockeyTeamHistoric
+from app.models.jobs import Job, JobStatus, JobType
+from benchmarks.serialize_rows import LegacyHockeyTeamResponse
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+JOB_ID = "load-test-job"
+PATHS = [f"/jobs/{JOB_ID}", "/results/hockey?limit=100"]
+
+
+def seed(url: str, rows: int, teams: int = 30) -> None:
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as session:
+        session.add(
+            Job(job_id=JOB_ID, job_type=JobType.HOCKEY, status=JobStatus.COMPLETED)
+        )
+        team_rows = [HockeyTeam(name=f"Team {i}") for i in range(teams)]
+        session.add_all(team_rows)
+        session.flush()
+        session.add_all(
+            HockeyTeamHistoric(
+                team_id=team_rows[i % teams].id,
+                year=1990 + i // teams,
+                wins=44,
+                losses=24,
+                losses_ot=14,
+                wins_percentage=0.537,
+                goals_for=251,
+                goals_against=229,
+                goal_difference=22,
+                job_id=JOB_ID,
+            )
+            for i in range(rows)
+        )
+        session.commit()
+    engine.dispose()
+
+
+def sync_app(url: str, pool_size: int, max_overflow: int):
+    """The endpoints as they were: sync handlers, sync engine, ORM queries."""
+    from app.main import _job_response
+    from app.pagination import next_cursor, page_size, split_page
+    from app.results import hockey_select
+    from fastapi import Depends, FastAPI, HTTPException
+    from sqlalchemy.orm import Session as DBSession
+
+    engine = create_engine(url, pool_size=pool_size, max_overflow=max_overflow)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def get_session():
+        with session_factory() as session:
+            yield session
+
+    legacy = FastAPI()
+
+    @legacy.get("/health")
+    def health():
+        return {"status": "healthy"}
+
+    @legacy.get("/jobs/{job_id}")
+    def get_job(job_id: str, db: DBSession = Depends(get_session)):
+        job = db.query(Job).filter(Job.job_id == job_id).first()
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return _job_response(job)
+
+    @legacy.get("/results/hockey")
+    def get_all_hockey_results(limit: int = 100, db: DBSession = Depends(get_session)):
+        limit = page_size(limit)
+        stmt = hockey_select().order_by(HockeyTeamHistoric.id).limit(limit + 1)
+        results, has_more = split_page(
+            [LegacyHockeyTeamResponse(**row._mapping) for row in db.execute(stmt)],
+            limit,
+        )
+        return {
+            "total": len(results),
+            "limit": limit,
+            "next_cursor": next_cursor(results, has_more, "id"),
+            "results": results,
+        }
+
+    return legacy
+
+
+def async_app(url: str, pool_size: int, max_overflow: int, cache: bool):
+    """The current app on an async engine for ``url``."""
+    from app.database import async_database_url, get_async_session
+    from app.main import _job_results_cache, _listing_cache, app
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    engine = create_async_engine(
+        async_database_url(url), pool_size=pool_size, max_overflow=max_overflow
+    )
+
+    async def override_get_async_session():
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+
+    app.dependency_overrides[get_async_session] = override_get_async_session
+    if not cache:
+        _job_results_cache.maxsize = 0
+        _listing_cache.maxsize = 0
+    return app
+
+
+def serve(mode: str, url: str, port: int, pool_size: int, max_overflow: int, cache):
+    import uvicorn
+
+    if mode == "sync":
+        target = sync_app(url, pool_size, max_overflow)
+    else:
+        target = async_app(url, pool_size, max_overflow, cache)
+    uvicorn.run(
+        target,
+        host="127.0.0.1",
+        port=port,
+        lifespan="off",
+        log_level="warning",
+        backlog=4096,
+    )
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_ready(base_url: str, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f"server at {base_url} did not start")
+
+
+async def load(base_url: str, clients: int, requests: int) -> dict:
+    latencies: List[float] = []
+    errors: Counter = Counter()  # HTTP status / exception name → count
+    issued = 0
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=120
+    ) as client:
+
+        async def worker() -> None:
+            nonlocal issued
+            while issued < requests:
+                path = PATHS[issued % len(PATHS)]
+                issued += 1
+                start = time.perf_counter()
+                try:
+                    response = await client.get(path)
+                    if response.status_code != 200:
+                        errors[str(response.status_code)] += 1
+                except httpx.HTTPError as e:
+                    errors[type(e).__name__] += 1
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(clients)))
+        elapsed = time.perf_counter() - start
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "p50_ms": quantiles[49] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+        "rps": len(latencies) / elapsed,
+    }
+
+
+def raise_fd_limit() -> None:
+    # One socket per client on each side
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard == resource.RLIM_INFINITY or hard > soft:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def bench(mode: str, args, url: str) -> None:
+    port = free_port()
+    server = multiprocessing.Process(
+        target=serve,
+        args=(mode, url, port, args.pool_size, args.max_overflow, args.cache),
+        daemon=True,
+    )
+    server.start()
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        wait_ready(base_url)
+        asyncio.run(load(base_url, args.clients, min(args.clients, 50)))  # warm-up
+        stats = asyncio.run(load(base_url, args.clients, args.requests))
+    finally:
+        server.terminate()
+        server.join()
+
+    errors = stats["errors"]
+    detail = ", ".join(f"{n} {reason}" for reason, n in errors.most_common())
+    print(
+        f"{mode:>6}: {stats['requests']} req, {args.clients} clients → "
+        f"p50 {stats['p50_ms']:.1f} ms, p99 {stats['p99_ms']:.1f} ms, "
+        f"{stats['rps']:,.0f} req/s, {sum(errors.values())} errors"
+        + (f" ({detail})" if detail else "")
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url")
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--rows", type=int, default=600)
+    parser.add_argument("--pool-size", type=int, default=DB_POOL_SIZE)
+    parser.add_argument("--max-overflow", type=int, default=DB_MAX_OVERFLOW)
+    parser.add_argument("--cache", action="store_true")
+    parser.add_argument(
+        "--mode", nargs="+", choices=["sync", "async"], default=["sync", "async"]
+    )
+    args = parser.parse_args(argv)
+
+    raise_fd_limit()
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.url or f"sqlite:///{os.path.join(tmp, 'api_load.db')}"
+        seed(url, args.rows)
+        for mode in args.mode:
+            bench(mode, args, url)
+
+
+if __name__ == "__main__":
+    main()
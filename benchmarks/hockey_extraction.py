@@ -0,0 +1,48 @@
+"""
+Benchmark: rows/sec of HockeyHistoricScraper.parse_page_data per extraction mode.
+
+Loads the hockey page once in headless Chrome, then parses the #hockey table
+repeatedly with the legacy per-row/per-cell WebDriver calls ("elements") and
+with the single-round-trip outerHTML extraction ("html").
+
+Usage:
+    python -m benchmarks.hockey_extraction [--repeat 5] [--url URL]
+"""
+
+import argparse
+import time
+
+from app.config import SCRAPER_URLS
+from app.crawlers.crawler import HockeyHistoricScraper
+
+
+def bench(scraper: HockeyHistoricScraper, extraction: str, repeat: int) -> None:
+    scraper.extraction = extraction
+    page_data = scraper._extract_page_data()
+
+    rows = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        rows += len(scraper.parse_page_data(page_data))
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{extraction:>8}: {rows} rows in {elapsed:.3f}s "
+        f"→ {rows / elapsed:,.0f} rows/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default=SCRAPER_URLS["hockey"]["url"])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with HockeyHistoricScraper(headless=True, engine="selenium") as scraper:
+        scraper.driver.get(args.url)
+        for extraction in ("elements", "html"):
+            bench(scraper, extraction, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
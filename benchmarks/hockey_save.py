@@ -0,0 +1,122 @@
+"""
+Benchmark: rows/sec of HockeyHistoricScraper.save_to_database, before/after.
+
+"legacy" is the former per-row implementation (one SELECT per row, commit +
+refresh per new team); "bulk" is the current set-based one. Each round saves
+the rows on an empty schema.
+
+Usage:
+    python -m benchmarks.hockey_save [--rows 600] [--teams 30] [--repeat 3]
+                                     [--url postgresql://user:pw@host/db]
+
+Defaults to an in-memory SQLite database. Tables are dropped and recreated
+on ``--url``, so don't point it at a database holding real data.
+"""
+
+import argparse
+import time
+from typing import Dict, List
+from unittest.mock import patch
+
+import app.models.films  # noqa: F401 (tables for create_all)
+import app.models.fingerprints  # noqa: F401
+import app.models.jobs  # noqa: F401
+from app.crawlers.crawler import HockeyHistoricScraper
+from app.database import Base
+from app.models.hockey_teams import HockeyTeam, HockeyTeamHistoric
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+
+def make_rows(n: int, teams: int) -> List[Dict[str, str]]:
+    return [
+        {
+            "name": f"Team {i % teams}",
+            "year": str(1990 + i // teams),
+            "wins": "44",
+            "losses": "24",
+            "losses_ot": "14",
+            "wins_percentage": ".537",
+            "goals_for": "251",
+            "goals_against": "229",
+            "goal_difference": "22",
+        }
+        for i in range(n)
+    ]
+
+
+def save_legacy(session_factory, data: List[Dict[str, str]], job_id: str) -> None:
+    with session_factory() as session:
+        for row in data:
+            team = (
+                session.query(HockeyTeam)
+                .filter(HockeyTeam.name == row["name"])
+                .one_or_none()
+            )
+            if not team:
+                team = HockeyTeam(name=row["name"])
+                session.add(team)
+                session.commit()
+                session.refresh(team)
+            session.add(
+                HockeyTeamHistoric(
+                    team_id=team.id,
+                    year=int(row["year"]),
+                    wins=int(row["wins"]),
+                    losses=int(row["losses"]),
+                    losses_ot=int(row["losses_ot"]),
+                    wins_percentage=float(row["wins_percentage"]),
+                    goals_for=float(row["goals_for"]),
+                    goals_against=float(row["goals_against"]),
+                    goal_difference=float(row["goal_difference"]),
+                    job_id=job_id,
+                )
+            )
+        session.commit()
+
+
+def save_bulk(session_factory, data: List[Dict[str, str]], job_id: str) -> None:
+    with patch("app.crawlers.crawler.Session", session_factory):
+        HockeyHistoricScraper(engine="http").save_to_database(data, job_id)
+
+
+def bench(engine, name: str, save, data, repeat: int) -> None:
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    elapsed = 0.0
+    for _ in range(repeat):
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        start = time.perf_counter()
+        save(session_factory, data, "bench")
+        elapsed += time.perf_counter() - start
+
+    rows = len(data) * repeat
+    print(f"{name:>8}: {rows} rows in {elapsed:.3f}s → {rows / elapsed:,.0f} rows/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="sqlite://")
+    parser.add_argument("--rows", type=int, default=600)
+    parser.add_argument("--teams", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.url.startswith("sqlite"):
+        engine = create_engine(
+            args.url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    else:
+        engine = create_engine(args.url)
+
+    data = make_rows(args.rows, args.teams)
+    bench(engine, "legacy", save_legacy, data, args.repeat)
+    bench(engine, "bulk", save_bulk, data, args.repeat)
+    Base.metadata.drop_all(engine)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Microbenchmark: serializing hockey result rows to a JSON response body.
+
+"models" is the former path: one pydantic model built per row, then
+FastAPI's ``jsonable_encoder`` and the stdlib encoder of ``JSONResponse``.
+"fast" is the current one (``app.responses``): row mappings validated once
+with the cached ``TypeAdapter`` of the list type and encoded with orjson;
+"fast-stdlib" is the same without orjson (its fallback).
+
+Usage:
+    python -m benchmarks.serialize_rows [--rows 10000] [--repeat 5]
+
+Rows are real SQLAlchemy ``Row`` objects fetched from an in-memory SQLite
+database; only the serialization is timed.
+"""
+
+import argparse
+import time
+from typing import Callable, List
+from unittest.mock import patch
+
+import app.models.films  # noqa: F401 (tables for create_all)
+import app.models.jobs  # noqa: F401
+from app.database import Base
+from app.main import HockeyTeamResponse
+from app.models.hockey_teams import HockeyTeam, HockeyTeamHistoric
+from app.responses import dumps, validate
+from app.results import hockey_select
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import Row, create_engine
+from sqlalchemy.orm import Session
+
+
+class LegacyHockeyTeamResponse(BaseModel):
+    """``HockeyTeamResponse`` as it was: a model built per row."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    year: int
+    wins: int
+    losses: int
+    losses_ot: int
+    wins_percentage: float
+    goals_for: float
+    goals_against: float
+    goal_difference: float
+
+
+def fetch_rows(n: int, teams: int = 30) -> List[Row]:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        team_rows = [HockeyTeam(name=f"Team {i}") for i in range(teams)]
+        session.add_all(team_rows)
+        session.flush()
+        session.add_all(
+            HockeyTeamHistoric(
+                team_id=team_rows[i % teams].id,
+                year=1990 + i // teams,
+                wins=44,
+                losses=24,
+                losses_ot=14,
+                wins_percentage=0.537,
+                goals_for=251,
+                goals_against=229,
+                goal_difference=22,
+            )
+            for i in range(n)
+        )
+        session.commit()
+        return session.execute(hockey_select().order_by(HockeyTeamHistoric.id)).all()
+
+
+def models(rows: List[Row]) -> bytes:
+    results = [LegacyHockeyTeamResponse(**row._mapping) for row in rows]
+    return JSONResponse(jsonable_encoder({"results": results})).body
+
+
+def fast(rows: List[Row]) -> bytes:
+    results = validate(List[HockeyTeamResponse], [row._mapping for row in rows])
+    return dumps({"results": results})
+
+
+def fast_stdlib(rows: List[Row]) -> bytes:
+    with patch("app.responses.orjson", None):
+        return fast(rows)
+
+
+def bench(name: str, serialize: Callable[[List[Row]], bytes], rows, repeat: int):
+    serialize(rows)  # warm-up (builds the TypeAdapter)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = serialize(rows)
+        best = min(best, time.perf_counter() - start)
+    print(
+        f"{name:>12}: {len(rows)} rows in {best * 1000:.1f} ms "
+        f"→ {len(rows) / best:,.0f} rows/s ({len(body):,} bytes)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = fetch_rows(args.rows)
+    bench("models", models, rows, args.repeat)
+    bench("fast", fast, rows, args.repeat)
+    bench("fast-stdlib", fast_stdlib, rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()